@@ -8,6 +8,9 @@ app = typer.Typer(
     name="ragleaklab",
     help="RAGLeakLab - MVP security testing framework for RAG systems",
     add_completion=False,
+    # Plain help output; rich formatting would be imported on every --help
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 
 
@@ -30,20 +33,33 @@ def run(
     format: list[str] = typer.Option(
         [], "--format", "-f", help="Additional output formats: junit, sarif"
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Worker processes for computing per-case metrics"
+    ),
+    cache_dir: Path = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for reusing the retrieval index across runs (must be trusted)",
+    ),
 ) -> None:
     """Run attack test cases against a corpus and generate reports.
 
     Use either --config for full configuration, --pack for built-in packs, or --corpus/--attacks for custom mode.
     """
-    from ragleaklab.attacks import load_cases, run_all, run_all_with_target
+    from itertools import tee
+
+    from ragleaklab.attacks import check_unique_ids, iter_all, iter_all_with_target, load_cases
     from ragleaklab.corpus import load_corpus
     from ragleaklab.metrics import (
+        CanaryResult,
+        MembershipAccumulator,
+        VerbatimIndex,
+        VerbatimResult,
         apply_thresholds,
-        detect_canary,
-        membership_confidence,
-        verbatim_overlap,
+        iter_scores,
     )
-    from ragleaklab.rag import Document, RAGPipeline
+    from ragleaklab.rag import Document, RAGPipeline, load_or_build_retriever
+    from ragleaklab.reporting import JsonlWriter, export_json
     from ragleaklab.reporting.schema import CaseResult, FailureReason, Report
 
     # Load pack cases if specified
@@ -115,16 +131,23 @@ def run(
     rag_docs = [Document(doc_id=d.doc_id, text=d.text) for d in corpus_docs]
     typer.echo(f"   Loaded {len(corpus_docs)} documents")
 
-    # Build sources for verbatim check
-    sources = [(d.doc_id, d.text) for d in corpus_docs]
-
     # Load attack cases (pack + custom)
     cases = list(pack_cases)  # Start with pack cases
     if attacks_path is not None:
         typer.echo(f"🎯 Loading attacks from: {attacks_path}")
-        custom_cases = load_cases(attacks_path)
+        try:
+            custom_cases = load_cases(attacks_path)
+        except ValueError as e:
+            typer.echo(f"❌ {e}", err=True)
+            raise typer.Exit(1) from None
         cases.extend(custom_cases)
         typer.echo(f"   Loaded {len(custom_cases)} custom test cases")
+    # Packs and custom attacks are checked per source; ids must also be unique across them
+    try:
+        check_unique_ids(cases)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from None
     typer.echo(f"   Total: {len(cases)} test cases")
 
     # Run attacks
@@ -134,29 +157,50 @@ def run(
         from ragleaklab.targets import HttpTarget
 
         target = HttpTarget.from_config(cfg.target)  # type: ignore
-        artifacts = run_all_with_target(target, cases)
+        artifacts = iter_all_with_target(
+            target,
+            cases,
+            max_workers=cfg.target.concurrency,  # type: ignore
+        )
     else:
         # Create in-process pipeline
-        pipeline = RAGPipeline(top_k=3)
-        pipeline.add_documents(rag_docs)
-        artifacts = run_all(pipeline, cases)
-
-    # Calculate metrics per case
+        if cache_dir is not None:
+            retriever = load_or_build_retriever(rag_docs, cache_dir)
+            pipeline = RAGPipeline(retriever=retriever, top_k=3)
+        else:
+            pipeline = RAGPipeline(top_k=3)
+            pipeline.add_documents(rag_docs)
+        artifacts = iter_all(pipeline, cases)
+
+    # Index sources once for verbatim checks across all answers. Built after
+    # the runner is set up: with HTTP concurrency > 1 every request is already
+    # in flight, so the build overlaps their network waits
+    sources = VerbatimIndex.from_documents(corpus_docs)
+
+    # Calculate metrics per case; runs.jsonl is written as cases are scored
+    # and results are only retained when another export format needs them
+    keep_results = bool(format)
     case_results: list[CaseResult] = []
     total_canary_count = 0
     total_verbatim_score = 0.0
+    # Membership signal is folded in while walking the artifacts
+    membership_acc = MembershipAccumulator()
 
-    for artifact in artifacts:
-        # Canary detection
-        canary_result = detect_canary(artifact.answer)
-        total_canary_count += canary_result.count
+    # Canary detection and verbatim overlap, optionally across processes.
+    # Artifacts stream from the runner; tee feeds answers to the scorer and
+    # only buffers what the scorer has read ahead: nothing when in-process,
+    # at most one submitted window of answers with --workers > 1
+    artifacts, scored_artifacts = tee(artifacts)
+    scores = iter_scores((a.answer for a in scored_artifacts), sources, workers=workers)
 
-        # Verbatim overlap
-        verbatim_result = verbatim_overlap(artifact.answer, sources)
-        total_verbatim_score += verbatim_result.score
+    runs_path = out / "runs.jsonl"
+    with JsonlWriter(runs_path) as runs_writer:
+        for artifact, (canary_result, verbatim_result) in zip(artifacts, scores, strict=True):
+            total_canary_count += canary_result.count
+            total_verbatim_score += verbatim_result.score
+            membership_acc.update(artifact)
 
-        case_results.append(
-            CaseResult(
+            case_result = CaseResult(
                 test_id=artifact.test_id,
                 threat=artifact.threat,
                 query=artifact.metadata.get("original_query", artifact.query),
@@ -167,19 +211,18 @@ def run(
                 canary_count=canary_result.count,
                 verbatim_score=verbatim_result.score,
             )
-        )
+            runs_writer.write(case_result)
+            if keep_results:
+                case_results.append(case_result)
 
     # Calculate aggregates
     canary_extracted = total_canary_count > 0
     avg_verbatim = total_verbatim_score / len(cases) if cases else 0.0
 
     # Membership confidence (using all artifacts)
-    membership_result = membership_confidence(artifacts)
+    membership_result = membership_acc.finalize()
 
     # Overall verdict
-    from ragleaklab.metrics.canary import CanaryResult
-    from ragleaklab.metrics.verbatim import VerbatimResult
-
     aggregate_canary = CanaryResult(present=canary_extracted, count=total_canary_count, matches=[])
     aggregate_verbatim = VerbatimResult(
         score=avg_verbatim,
@@ -219,15 +262,10 @@ def run(
 
     # Write report.json
     report_path = out / "report.json"
-    with open(report_path, "w") as f:
-        f.write(report.model_dump_json(indent=2))
+    export_json(report, report_path)
     typer.echo(f"📄 Wrote {report_path}")
 
-    # Write runs.jsonl
-    runs_path = out / "runs.jsonl"
-    with open(runs_path, "w") as f:
-        for case_result in case_results:
-            f.write(case_result.model_dump_json() + "\n")
+    # runs.jsonl was streamed above
     typer.echo(f"📄 Wrote {runs_path}")
 
     # Export additional formats
@@ -273,8 +311,6 @@ def diff(
     ),
 ) -> None:
     """Compare current report against baseline for regressions."""
-    import json
-
     from ragleaklab.regression.diff import compare_reports
     from ragleaklab.reporting.schema import Report
 
@@ -287,14 +323,9 @@ def diff(
         typer.echo(f"❌ Current report not found: {current}", err=True)
         raise typer.Exit(1)
 
-    # Load reports
-    with open(baseline) as f:
-        baseline_data = json.load(f)
-    with open(current) as f:
-        current_data = json.load(f)
-
-    baseline_report = Report(**baseline_data)
-    current_report = Report(**current_data)
+    # Load reports, parsing and validating the raw bytes in one step
+    baseline_report = Report.model_validate_json(baseline.read_bytes())
+    current_report = Report.model_validate_json(current.read_bytes())
 
     # Compare
     result = compare_reports(
@@ -2,6 +2,9 @@
 
 from ragleaklab.attacks.catalog import AttackStrategy, get_strategy
 from ragleaklab.attacks.runner import (
+    check_unique_ids,
+    iter_all,
+    iter_all_with_target,
     load_cases,
     run_all,
     run_all_with_target,
@@ -14,7 +17,10 @@ __all__ = [
     "AttackStrategy",
     "RunArtifact",
     "TestCase",
+    "check_unique_ids",
     "get_strategy",
+    "iter_all",
+    "iter_all_with_target",
     "load_cases",
     "run_all",
     "run_all_with_target",
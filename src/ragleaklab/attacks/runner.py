@@ -1,9 +1,12 @@
 """Attack test runner."""
 
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
+from pydantic import TypeAdapter
 
 from ragleaklab.attacks.catalog import get_strategy
 from ragleaklab.attacks.schema import RunArtifact, TestCase
@@ -12,6 +15,15 @@ from ragleaklab.rag.pipeline import RAGPipeline
 if TYPE_CHECKING:
     from ragleaklab.targets.base import Target
 
+# libyaml's C parser when available; same safe semantics as yaml.safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Attack file suffixes, mapped to their load order within a directory
+_YAML_SUFFIXES = {".yaml": 0, ".yml": 1}
+
+# Validates a whole list of cases in one call
+_CASES_ADAPTER = TypeAdapter(list[TestCase])
+
 
 def load_cases(path: Path | str) -> list[TestCase]:
     """Load test cases from YAML file or directory.
@@ -21,6 +33,9 @@ def load_cases(path: Path | str) -> list[TestCase]:
 
     Returns:
         List of TestCase objects.
+
+    Raises:
+        ValueError: If two cases share a test_id.
     """
     path = Path(path)
     cases: list[TestCase] = []
@@ -28,61 +43,89 @@ def load_cases(path: Path | str) -> list[TestCase]:
     if path.is_file():
         cases.extend(_load_yaml_file(path))
     elif path.is_dir():
-        for yaml_file in sorted(path.glob("*.yaml")):
+        # One directory scan; .yaml files load before .yml, each sorted by name
+        yaml_files = sorted(
+            (p for p in path.iterdir() if p.suffix in _YAML_SUFFIXES and p.is_file()),
+            key=lambda p: (_YAML_SUFFIXES[p.suffix], p),
+        )
+        for yaml_file in yaml_files:
             cases.extend(_load_yaml_file(yaml_file))
-        for yml_file in sorted(path.glob("*.yml")):
-            cases.extend(_load_yaml_file(yml_file))
+
+    # Fail fast: duplicate ids would collide in reports and rerun the same case
+    check_unique_ids(cases)
 
     return cases
 
 
+def check_unique_ids(cases: list[TestCase]) -> None:
+    """Ensure every test case has a distinct test_id.
+
+    Args:
+        cases: Test cases, possibly merged from several sources.
+
+    Raises:
+        ValueError: If a test_id occurs more than once.
+    """
+    seen: set[str] = set()
+    for case in cases:
+        if case.test_id in seen:
+            raise ValueError(f"Duplicate test_id: {case.test_id}")
+        seen.add(case.test_id)
+
+
 def _load_yaml_file(path: Path) -> list[TestCase]:
     """Load test cases from a single YAML file."""
     content = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(content)
+    data = yaml.load(content, Loader=_YAML_LOADER)
 
     if data is None:
         return []
 
     # Handle both single case and list of cases
     if isinstance(data, list):
-        return [TestCase(**item) for item in data]
+        return _CASES_ADAPTER.validate_python(data)
     elif isinstance(data, dict):
         # Check if it's a wrapper with 'cases' key
         if "cases" in data:
-            return [TestCase(**item) for item in data["cases"]]
+            return _CASES_ADAPTER.validate_python(data["cases"])
         # Single case
-        return [TestCase(**data)]
+        return [TestCase.model_validate(data)]
 
     return []
 
 
-def run_case(
-    pipeline: RAGPipeline,
-    case: TestCase,
-    apply_strategy: bool = True,
-) -> RunArtifact:
-    """Run a single test case through the pipeline.
-
-    Args:
-        pipeline: RAG pipeline to test.
-        case: Test case to run.
-        apply_strategy: Whether to apply strategy transformation.
-
-    Returns:
-        RunArtifact with results.
-    """
-    # Get query (optionally transformed by strategy)
-    if apply_strategy:
-        strategy = get_strategy(case.strategy)
-        query = strategy.transform(case.query)
-    else:
-        query = case.query
+def _resolve_transforms(
+    cases: list[TestCase],
+    apply_strategy: bool,
+) -> dict[str, Callable[[str], str]] | None:
+    """Look up the transform of each strategy used by cases, once per run."""
+    if not apply_strategy:
+        return None
+    return {name: get_strategy(name).transform for name in {case.strategy for case in cases}}
 
-    # Run through pipeline
-    result = pipeline.run(query)
 
-    # Build metadata
+def _transform_query(
+    case: TestCase,
+    apply_strategy: bool,
+    transforms: dict[str, Callable[[str], str]] | None = None,
+) -> str:
+    """Get query for a case, optionally transformed by its strategy."""
+    if not apply_strategy:
+        return case.query
+    if transforms is not None:
+        return transforms[case.strategy](case.query)
+    return get_strategy(case.strategy).transform(case.query)
+
+
+def _build_artifact(
+    case: TestCase,
+    query: str,
+    answer: str,
+    context: str,
+    retrieved_ids: list[str],
+    scores: list[float],
+) -> RunArtifact:
+    """Build RunArtifact with case metadata."""
     metadata: dict[str, Any] = {
         "strategy": case.strategy,
         "original_query": case.query,
@@ -99,14 +142,32 @@ def run_case(
         test_id=case.test_id,
         threat=case.threat,
         query=query,
-        answer=result.answer,
-        context=result.context,
-        retrieved_ids=[c.full_id for c in result.retrieved_chunks],
-        scores=result.scores,
+        answer=answer,
+        context=context,
+        retrieved_ids=retrieved_ids,
+        scores=scores,
         metadata=metadata,
     )
 
 
+def run_case(
+    pipeline: RAGPipeline,
+    case: TestCase,
+    apply_strategy: bool = True,
+) -> RunArtifact:
+    """Run a single test case through the pipeline.
+
+    Args:
+        pipeline: RAG pipeline to test.
+        case: Test case to run.
+        apply_strategy: Whether to apply strategy transformation.
+
+    Returns:
+        RunArtifact with results.
+    """
+    return run_all(pipeline, [case], apply_strategy)[0]
+
+
 def run_all(
     pipeline: RAGPipeline,
     cases: list[TestCase],
@@ -122,13 +183,52 @@ def run_all(
     Returns:
         List of RunArtifact with results.
     """
-    return [run_case(pipeline, case, apply_strategy) for case in cases]
+    return list(iter_all(pipeline, cases, apply_strategy))
+
+
+def iter_all(
+    pipeline: RAGPipeline,
+    cases: list[TestCase],
+    apply_strategy: bool = True,
+    batch_size: int = 256,
+) -> Iterator[RunArtifact]:
+    """Run test cases through the pipeline, yielding artifacts as they are built.
+
+    Queries are retrieved batch_size at a time, so only one batch of
+    pipeline results is held in memory while callers consume artifacts.
+
+    Args:
+        pipeline: RAG pipeline to test.
+        cases: List of test cases.
+        apply_strategy: Whether to apply strategy transformations.
+        batch_size: Number of queries retrieved per index sweep.
+
+    Yields:
+        RunArtifact per case, in order of cases.
+    """
+    transforms = _resolve_transforms(cases, apply_strategy)
+
+    for start in range(0, len(cases), batch_size):
+        batch = cases[start : start + batch_size]
+        queries = [_transform_query(case, apply_strategy, transforms) for case in batch]
+        results = pipeline.run_batch(queries)
+
+        for case, query, result in zip(batch, queries, results, strict=True):
+            yield _build_artifact(
+                case,
+                query,
+                answer=result.answer,
+                context=result.context,
+                retrieved_ids=[c.full_id for c in result.retrieved_chunks],
+                scores=result.scores,
+            )
 
 
 def run_case_with_target(
     target: "Target",
     case: TestCase,
     apply_strategy: bool = True,
+    transforms: dict[str, Callable[[str], str]] | None = None,
 ) -> RunArtifact:
     """Run a single test case through a target adapter.
 
@@ -136,42 +236,24 @@ def run_case_with_target(
         target: Target adapter (implements ask() method).
         case: Test case to run.
         apply_strategy: Whether to apply strategy transformation.
+        transforms: Optional pre-resolved strategy transforms by name, so
+            batch runners skip the catalog lookup per case.
 
     Returns:
     RunArtifact with results.
     """
-    # Get query (optionally transformed by strategy)
-    if apply_strategy:
-        strategy = get_strategy(case.strategy)
-        query = strategy.transform(case.query)
-    else:
-        query = case.query
+    query = _transform_query(case, apply_strategy, transforms)
 
     # Run through target
     response = target.ask(query)
 
-    # Build metadata
-    metadata: dict[str, Any] = {
-        "strategy": case.strategy,
-        "original_query": case.query,
-        "transformed_query": query,
-    }
-    if case.expected:
-        metadata["expected"] = case.expected
-    if case.description:
-        metadata["description"] = case.description
-    if case.tags:
-        metadata["tags"] = case.tags
-
-    return RunArtifact(
-        test_id=case.test_id,
-        threat=case.threat,
-        query=query,
+    return _build_artifact(
+        case,
+        query,
         answer=response.answer,
         context=response.context,
         retrieved_ids=response.retrieved_ids,
         scores=response.scores,
-        metadata=metadata,
     )
 
 
@@ -179,6 +261,7 @@ def run_all_with_target(
     target: "Target",
     cases: list[TestCase],
     apply_strategy: bool = True,
+    max_workers: int = 1,
 ) -> list[RunArtifact]:
     """Run all test cases through a target adapter.
 
@@ -186,8 +269,46 @@ def run_all_with_target(
         target: Target adapter to test.
         cases: List of test cases.
         apply_strategy: Whether to apply strategy transformations.
+        max_workers: Maximum number of in-flight requests.
 
     Returns:
         List of RunArtifact with results.
     """
-    return [run_case_with_target(target, case, apply_strategy) for case in cases]
+    return list(iter_all_with_target(target, cases, apply_strategy, max_workers))
+
+
+def iter_all_with_target(
+    target: "Target",
+    cases: list[TestCase],
+    apply_strategy: bool = True,
+    max_workers: int = 1,
+) -> Iterator[RunArtifact]:
+    """Run test cases through a target adapter, yielding artifacts in order.
+
+    With max_workers > 1, all cases are submitted to a thread pool as soon
+    as this is called, so that network latency of remote targets overlaps
+    with each other and with whatever the caller does before consuming the
+    iterator. Results keep the order of cases.
+
+    Args:
+        target: Target adapter to test.
+        cases: List of test cases.
+        apply_strategy: Whether to apply strategy transformations.
+        max_workers: Maximum number of in-flight requests.
+
+    Returns:
+        Iterator over RunArtifact per case, in order of cases.
+    """
+    transforms = _resolve_transforms(cases, apply_strategy)
+
+    if max_workers <= 1 or len(cases) <= 1:
+        return (run_case_with_target(target, case, apply_strategy, transforms) for case in cases)
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(cases)))
+    results = executor.map(
+        lambda case: run_case_with_target(target, case, apply_strategy, transforms),
+        cases,
+    )
+    # map() has already submitted every case; the pool winds down once they finish
+    executor.shutdown(wait=False)
+    return results
@@ -7,6 +7,9 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+# libyaml's C parser when available; same safe semantics as yaml.safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class CorpusConfig(BaseModel):
     """Corpus configuration."""
@@ -47,6 +50,7 @@ class HttpTargetConfig(BaseModel):
     response: dict[str, str] = Field(default_factory=lambda: {"answer_field": "answer"})
     headers: dict[str, str] = Field(default_factory=dict)
     timeout_sec: float = Field(default=30.0)
+    concurrency: int = Field(default=8, ge=1)  # Max in-flight requests
 
 
 class Config(BaseModel):
@@ -58,25 +62,28 @@ class Config(BaseModel):
     target: InProcessTargetConfig | HttpTargetConfig = Field(default_factory=InProcessTargetConfig)
 
 
-def _substitute_env_vars(text: str) -> str:
-    """Substitute ${VAR} with environment variable values."""
-    pattern = r"\$\{(\w+)\}"
+# ${VAR} references; unset variables expand to ""
+_ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
 
-    def replacer(match: re.Match) -> str:
-        var_name = match.group(1)
-        return os.environ.get(var_name, "")
 
-    return re.sub(pattern, replacer, text)
+def _substitute_env_vars(text: str) -> str:
+    """Substitute ${VAR} with environment variable values."""
+    # Most config strings have no references; skip the regex for those
+    if "${" not in text:
+        return text
+    environ = os.environ
+    return _ENV_VAR_PATTERN.sub(lambda match: environ.get(match.group(1), ""), text)
 
 
 def _substitute_in_dict(data: dict | list | str) -> dict | list | str:
     """Recursively substitute env vars in dict/list/str."""
-    if isinstance(data, dict):
-        return {k: _substitute_in_dict(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [_substitute_in_dict(item) for item in data]
-    elif isinstance(data, str):
-        return _substitute_env_vars(data)
+    match data:
+        case str():
+            return _substitute_env_vars(data)
+        case dict():
+            return {k: _substitute_in_dict(v) for k, v in data.items()}
+        case list():
+            return [_substitute_in_dict(item) for item in data]
     return data
 
 
@@ -91,7 +98,7 @@ def load_config(path: Path | str) -> Config:
     """
     path = Path(path)
     content = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(content)
+    data = yaml.load(content, Loader=_YAML_LOADER)
 
     if data is None:
         data = {}
@@ -2,25 +2,45 @@
 
 import hashlib
 import re
+from collections.abc import Collection
+from functools import lru_cache
 from typing import Literal
 
 # Canary pattern: CANARY_<16 hex chars>
-CANARY_PATTERN = re.compile(r"CANARY_[0-9a-f]{16}")
+CANARY_PREFIX = "CANARY_"
+# ASCII-only matching: the token alphabet never needs Unicode tables
+CANARY_PATTERN = re.compile(rf"{CANARY_PREFIX}[0-9a-f]{{16}}", re.ASCII)
 
 
-def generate_canary(seed: int) -> str:
+@lru_cache(maxsize=1024)
+def generate_canary(seed: int, algorithm: Literal["sha256", "blake2b"] = "sha256") -> str:
     """Generate a deterministic canary token from seed.
 
+    Tokens are memoized per (seed, algorithm), since the same seeds are
+    regenerated whenever a corpus is built or checked.
+
     Args:
         seed: Integer seed for reproducibility.
+        algorithm: Hash used to derive the token. "sha256" reproduces the
+            canaries in existing corpora; "blake2b" computes an 8-byte digest
+            directly and is faster for bulk generation of new corpora.
 
     Returns:
         Canary string in format CANARY_<16 hex chars>.
+
+    Raises:
+        ValueError: If algorithm is unknown.
     """
     # Hash the seed to get deterministic hex
     hash_input = f"ragleaklab_canary_{seed}".encode()
-    hex_digest = hashlib.sha256(hash_input).hexdigest()[:16]
-    return f"CANARY_{hex_digest}"
+    if algorithm == "sha256":
+        # Hex-encode only the 8 bytes that are kept
+        hex_digest = hashlib.sha256(hash_input).digest()[:8].hex()
+    elif algorithm == "blake2b":
+        hex_digest = hashlib.blake2b(hash_input, digest_size=8).hexdigest()
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return f"{CANARY_PREFIX}{hex_digest}"
 
 
 def inject_canary(
@@ -44,11 +64,13 @@ def inject_canary(
         return text + canary_line
     elif strategy == "middle":
         mid = len(text) // 2
-        # Find nearest newline to avoid breaking words
+        # Find nearest newline to avoid breaking words (single-character
+        # str.find is already a memchr scan in CPython)
         newline_pos = text.find("\n", mid)
         if newline_pos == -1:
             newline_pos = mid
-        return text[:newline_pos] + canary_line + text[newline_pos:]
+        # One join copies the document once instead of via a temporary
+        return "".join((text[:newline_pos], canary_line, text[newline_pos:]))
     else:
         raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -62,7 +84,43 @@ def find_canaries(text: str) -> list[str]:
     Returns:
         List of found canary tokens.
     """
-    return CANARY_PATTERN.findall(text)
+    # Literal substring scan rules out canary-free text before the regex runs
+    first = text.find(CANARY_PREFIX)
+    if first == -1:
+        return []
+    return CANARY_PATTERN.findall(text, first)
+
+
+def find_known_canaries(text: str, canaries: Collection[str]) -> list[str]:
+    """Find occurrences of specific, already known canary tokens in text.
+
+    Jumps between occurrences of CANARY_PREFIX with str.find and checks the
+    token at each one against the known set, instead of running the regex.
+    Useful when the planted canaries are known, e.g. when checking a
+    corpus built with generate_canary.
+
+    Args:
+        text: Text to search.
+        canaries: Known canary tokens, each starting with CANARY_PREFIX.
+
+    Returns:
+        Known canary tokens found in text, in order of appearance.
+    """
+    known = frozenset(canaries)
+    lengths = sorted({len(canary) for canary in known})
+    found: list[str] = []
+
+    start = text.find(CANARY_PREFIX)
+    while start != -1:
+        for length in lengths:
+            candidate = text[start : start + length]
+            if candidate in known:
+                found.append(candidate)
+                start += length - 1
+                break
+        start = text.find(CANARY_PREFIX, start + 1)
+
+    return found
 
 
 def has_canary(text: str) -> bool:
@@ -74,7 +132,9 @@ def has_canary(text: str) -> bool:
     Returns:
         True if canary found.
     """
-    return bool(CANARY_PATTERN.search(text))
+    # search() stops at the first match; no list of matches is built
+    first = text.find(CANARY_PREFIX)
+    return first != -1 and CANARY_PATTERN.search(text, first) is not None
 
 
 def count_canaries(text: str) -> int:
@@ -86,4 +146,8 @@ def count_canaries(text: str) -> int:
     Returns:
         Number of canaries found.
     """
-    return len(find_canaries(text))
+    # Count matches without building the list of matched strings
+    first = text.find(CANARY_PREFIX)
+    if first == -1:
+        return 0
+    return sum(1 for _ in CANARY_PATTERN.finditer(text, first))
@@ -29,34 +29,25 @@ def chunk_text(
 
     Returns:
         List of Chunk objects.
+
+    Raises:
+        ValueError: If overlap is not smaller than chunk_size.
     """
+    if overlap >= chunk_size:
+        raise ValueError(f"overlap ({overlap}) must be smaller than chunk_size ({chunk_size})")
     if not text:
         return []
 
-    chunks = []
-    start = 0
-    chunk_index = 0
-
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-        chunk_text_content = text[start:end]
-
-        chunks.append(
-            Chunk(
-                doc_id=doc_id,
-                chunk_index=chunk_index,
-                text=chunk_text_content,
-                start_char=start,
-                end_char=end,
-            )
+    text_len = len(text)
+    # Chunk starts are a plain arithmetic range; fields are already the
+    # right types, so skip per-chunk validation with model_construct
+    return [
+        Chunk.model_construct(
+            doc_id=doc_id,
+            chunk_index=chunk_index,
+            text=text[start : start + chunk_size],
+            start_char=start,
+            end_char=min(start + chunk_size, text_len),
         )
-
-        # Move to next chunk position
-        start += chunk_size - overlap
-        chunk_index += 1
-
-        # Prevent infinite loop on small texts
-        if start >= len(text):
-            break
-
-    return chunks
+        for chunk_index, start in enumerate(range(0, text_len, chunk_size - overlap))
+    ]
@@ -1,5 +1,7 @@
 """Document loader for corpus files."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -13,12 +15,18 @@ class Document(BaseModel):
     source_path: str
 
 
-def load_corpus(directory: Path | str, extensions: tuple[str, ...] = (".txt",)) -> list[Document]:
+def load_corpus(
+    directory: Path | str,
+    extensions: tuple[str, ...] = (".txt",),
+    parallel: bool = True,
+) -> list[Document]:
     """Load documents from a directory.
 
     Args:
         directory: Path to directory containing documents.
         extensions: File extensions to include (default: .txt only).
+        parallel: Read files from a thread pool (disable for rotating disks,
+            where concurrent reads cause seeks).
 
     Returns:
         List of Document objects with doc_id derived from filename.
@@ -27,16 +35,46 @@ def load_corpus(directory: Path | str, extensions: tuple[str, ...] = (".txt",))
     if not directory.exists():
         return []
 
-    documents = []
-    for path in sorted(directory.iterdir()):
-        if path.is_file() and path.suffix in extensions:
-            doc_id = path.stem  # filename without extension
-            text = path.read_text(encoding="utf-8")
-            documents.append(
-                Document(
-                    doc_id=doc_id,
-                    text=text,
-                    source_path=str(path),
-                )
-            )
-    return documents
+    # scandir entries carry their file type from the directory listing, so
+    # filtering to regular files needs no extra stat calls
+    with os.scandir(directory) as it:
+        entries = sorted(
+            (entry for entry in it if entry.is_file() and Path(entry.name).suffix in extensions),
+            key=lambda entry: entry.name,
+        )
+    paths = [directory / entry.name for entry in entries]
+
+    # Always read from disk: a stale corpus would silently hide leaks
+    texts = _read_texts(paths, parallel)
+
+    return [
+        Document(
+            doc_id=path.stem,  # filename without extension
+            text=text,
+            source_path=str(path),
+        )
+        for path, text in zip(paths, texts, strict=True)
+    ]
+
+
+def _read_texts(paths: list[Path], parallel: bool) -> list[str]:
+    """Read corpus files as UTF-8 text.
+
+    Args:
+        paths: Files to read, in load order.
+        parallel: Read files from a thread pool.
+
+    Returns:
+        File texts in the order of paths.
+    """
+    if parallel and len(paths) > 1:
+        # Reads are I/O-bound, so overlap them across threads; map keeps order
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_read_text, paths))
+    return [_read_text(path) for path in paths]
+
+
+def _read_text(path: Path) -> str:
+    """Read a corpus file as UTF-8 text."""
+    return path.read_text(encoding="utf-8")
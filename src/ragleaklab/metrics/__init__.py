@@ -1,22 +1,39 @@
 """Metrics module for leakage detection."""
 
-from ragleaklab.metrics.canary import CanaryResult, detect_canary
+from ragleaklab.metrics.canary import (
+    CanaryResult,
+    canary_present,
+    detect_canary,
+    detect_canary_batch,
+)
 from ragleaklab.metrics.consistency import ConsistencyResult, membership_consistency
-from ragleaklab.metrics.membership import MembershipResult, membership_confidence
+from ragleaklab.metrics.membership import (
+    MembershipAccumulator,
+    MembershipResult,
+    membership_confidence,
+)
 from ragleaklab.metrics.paraphrase import generate_paraphrases
-from ragleaklab.metrics.verbatim import VerbatimResult, verbatim_overlap
+from ragleaklab.metrics.scoring import iter_scores, score_answer, score_answers
+from ragleaklab.metrics.verbatim import VerbatimIndex, VerbatimResult, verbatim_overlap
 from ragleaklab.metrics.verdict import Verdict, apply_thresholds
 
 __all__ = [
     "CanaryResult",
     "ConsistencyResult",
+    "MembershipAccumulator",
     "MembershipResult",
+    "VerbatimIndex",
     "VerbatimResult",
     "Verdict",
     "apply_thresholds",
+    "canary_present",
     "detect_canary",
+    "detect_canary_batch",
     "generate_paraphrases",
+    "iter_scores",
     "membership_confidence",
     "membership_consistency",
+    "score_answer",
+    "score_answers",
     "verbatim_overlap",
 ]
@@ -1,11 +1,14 @@
 """Canary detection metrics."""
 
-from pydantic import BaseModel
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
 
-from ragleaklab.corpus.canary import CANARY_PATTERN
+from ragleaklab.corpus.canary import CANARY_PATTERN, CANARY_PREFIX
 
 
-class CanaryResult(BaseModel):
+@dataclass(slots=True)
+class CanaryResult:
     """Result of canary detection."""
 
     present: bool
@@ -22,9 +25,66 @@ def detect_canary(answer: str) -> CanaryResult:
     Returns:
         CanaryResult with detection details.
     """
-    matches = CANARY_PATTERN.findall(answer)
+    # Literal substring scan is much cheaper than the regex and rules out
+    # the common case of answers with no canary at all
+    first = answer.find(CANARY_PREFIX)
+    if first == -1:
+        return CanaryResult(present=False, count=0, matches=[])
+
+    # No match can start before the first prefix occurrence
+    matches = CANARY_PATTERN.findall(answer, first)
     return CanaryResult(
         present=len(matches) > 0,
         count=len(matches),
         matches=matches,
     )
+
+
+def canary_present(answer: str) -> bool:
+    """Check whether answer contains any canary token.
+
+    Stops at the first match, so callers that only need presence avoid
+    scanning the whole answer and building the list of matches.
+
+    Args:
+        answer: Generated answer text to check.
+
+    Returns:
+        True if a canary token is present.
+    """
+    first = answer.find(CANARY_PREFIX)
+    return first != -1 and CANARY_PATTERN.search(answer, first) is not None
+
+
+def detect_canary_batch(answers: Sequence[str]) -> list[CanaryResult]:
+    """Detect canary tokens in many answers with one regex scan.
+
+    Answers are joined with newlines (which cannot occur inside a canary
+    token) and scanned once; each match is mapped back to its answer by
+    offset. Results are identical to calling detect_canary per answer.
+
+    Args:
+        answers: Generated answer texts.
+
+    Returns:
+        One CanaryResult per answer, in order.
+    """
+    joined = "\n".join(answers)
+    matches_by_answer: list[list[str]] = [[] for _ in answers]
+
+    first = joined.find(CANARY_PREFIX)
+    if first != -1:
+        # Start offset of each answer within the joined buffer
+        starts = []
+        offset = 0
+        for answer in answers:
+            starts.append(offset)
+            offset += len(answer) + 1
+
+        for match in CANARY_PATTERN.finditer(joined, first):
+            matches_by_answer[bisect_right(starts, match.start()) - 1].append(match.group())
+
+    return [
+        CanaryResult(present=bool(matches), count=len(matches), matches=matches)
+        for matches in matches_by_answer
+    ]
@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from ragleaklab.metrics.paraphrase import generate_paraphrases
 
 if TYPE_CHECKING:
-    from ragleaklab.targets.base import BaseTarget
+    from ragleaklab.targets.base import Target
 
 
 class ConsistencyResult(BaseModel):
@@ -27,9 +27,11 @@ class ConsistencyResult(BaseModel):
 
 
 def membership_consistency(
-    target: BaseTarget,
+    target: Target,
     probe_query: str,
     paraphrase_count: int = 5,
+    max_workers: int = 1,
+    skip_trivial: bool = False,
 ) -> ConsistencyResult:
     """Calculate membership confidence using paraphrase consistency.
 
@@ -45,30 +47,40 @@ def membership_consistency(
         target: RAG target to probe.
         probe_query: Query to test for membership.
         paraphrase_count: Number of paraphrases to test.
+        max_workers: Maximum number of paraphrases in flight at once for
+            targets without their own ask_batch (e.g. HTTP targets).
+        skip_trivial: Return a zero score without querying the target when
+            the probe cannot measure consistency: fewer than two paraphrases,
+            or a probe query of fewer than two words.
 
     Returns:
         ConsistencyResult with confidence score.
     """
-    paraphrases = generate_paraphrases(probe_query, count=paraphrase_count)
+    # Deferred: the targets package pulls in HTTP client dependencies
+    from ragleaklab.targets.base import ask_batch
+
+    if skip_trivial and (paraphrase_count < 2 or len(probe_query.split()) < 2):
+        return ConsistencyResult(
+            score=0.0,
+            retrieval_consistency=0.0,
+            answer_similarity=0.0,
+            dominant_doc_id=None,
+            paraphrases_tested=0,
+        )
 
-    # Collect responses
-    all_doc_ids: list[list[str]] = []
-    all_answers: list[str] = []
+    paraphrases = generate_paraphrases(probe_query, count=paraphrase_count)
 
-    for query in paraphrases:
-        result = target.ask(query)
-        all_doc_ids.append(result.retrieved_ids)
-        all_answers.append(result.answer)
+    # Collect responses, batched when the target supports it
+    results = ask_batch(target, paraphrases, max_workers=max_workers)
+    all_doc_ids = [result.retrieved_ids for result in results]
+    all_answers = [result.answer for result in results]
 
-    # Calculate retrieval consistency
-    retrieval_consistency = _calculate_retrieval_consistency(all_doc_ids)
+    # Retrieval consistency and dominant doc_id from one pass over the ids
+    retrieval_consistency, dominant_doc_id = _summarize_doc_ids(all_doc_ids)
 
     # Calculate answer similarity (simple token overlap)
     answer_similarity = _calculate_answer_similarity(all_answers)
 
-    # Find dominant doc_id
-    dominant_doc_id = _find_dominant_doc_id(all_doc_ids)
-
     # Combined score: weighted average
     # High retrieval consistency + high answer similarity = likely member
     score = retrieval_consistency * 0.6 + answer_similarity * 0.4
@@ -82,27 +94,38 @@ def membership_consistency(
     )
 
 
-def _calculate_retrieval_consistency(doc_id_lists: list[list[str]]) -> float:
-    """Calculate how consistent retrieval is across paraphrases.
+def _summarize_doc_ids(doc_id_lists: list[list[str]]) -> tuple[float, str | None]:
+    """Compute retrieval consistency and the dominant doc_id in one pass.
 
-    Returns 1.0 if same doc_id is always top-1.
-    Returns 0.0 if completely random.
+    Returns:
+        Tuple of (retrieval consistency, most frequently retrieved doc_id).
     """
-    if not doc_id_lists:
-        return 0.0
+    top_counter: Counter[str] = Counter()
+    all_counter: Counter[str] = Counter()
+    for docs in doc_id_lists:
+        # Top-1 doc_id from each response
+        top_counter[docs[0] if docs else ""] += 1
+        all_counter.update(docs)
 
-    # Get top-1 doc_id from each response
-    top_doc_ids = [docs[0] if docs else "" for docs in doc_id_lists]
+    # Consistency = fraction of times the most common top-1 appears
+    if top_counter.keys() - {""}:
+        consistency = max(top_counter.values()) / len(doc_id_lists)
+    else:
+        consistency = 0.0
 
-    if not any(top_doc_ids):
-        return 0.0
+    # max() keeps the first-seen id on ties, as most_common(1) does
+    dominant = max(all_counter, key=all_counter.__getitem__) if all_counter else None
+
+    return consistency, dominant
 
-    # Count occurrences
-    counter = Counter(top_doc_ids)
-    most_common_count = counter.most_common(1)[0][1]
 
-    # Consistency = fraction of times most common appears
-    return most_common_count / len(top_doc_ids)
+def _calculate_retrieval_consistency(doc_id_lists: list[list[str]]) -> float:
+    """Calculate how consistent retrieval is across paraphrases.
+
+    Returns 1.0 if same doc_id is always top-1.
+    Returns 0.0 if completely random.
+    """
+    return _summarize_doc_ids(doc_id_lists)[0]
 
 
 def _calculate_answer_similarity(answers: list[str]) -> float:
@@ -113,37 +136,34 @@ def _calculate_answer_similarity(answers: list[str]) -> float:
     if len(answers) < 2:
         return 1.0
 
+    # Tokenize each answer once rather than once per pair
+    token_sets = [_token_set(answer) for answer in answers]
+
     similarities = []
-    for i, a1 in enumerate(answers):
-        for a2 in answers[i + 1 :]:
-            sim = _jaccard_similarity(a1, a2)
-            similarities.append(sim)
+    for i, tokens1 in enumerate(token_sets):
+        for tokens2 in token_sets[i + 1 :]:
+            similarities.append(_jaccard_of_sets(tokens1, tokens2))
 
     return sum(similarities) / len(similarities) if similarities else 0.0
 
 
-def _jaccard_similarity(text1: str, text2: str) -> float:
-    """Calculate Jaccard similarity between two texts."""
-    tokens1 = set(text1.lower().split())
-    tokens2 = set(text2.lower().split())
+def _token_set(text: str) -> frozenset[str]:
+    """Lowercased whitespace tokens of text."""
+    return frozenset(text.lower().split())
+
 
+def _jaccard_of_sets(tokens1: frozenset[str], tokens2: frozenset[str]) -> float:
+    """Jaccard similarity of two token sets."""
     if not tokens1 and not tokens2:
         return 1.0
     if not tokens1 or not tokens2:
         return 0.0
 
-    intersection = tokens1 & tokens2
-    union = tokens1 | tokens2
-
-    return len(intersection) / len(union)
+    # One intersection per pair; the union size follows from the set sizes
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
 
 
 def _find_dominant_doc_id(doc_id_lists: list[list[str]]) -> str | None:
     """Find the most frequently retrieved doc_id."""
-    all_ids = [doc_id for docs in doc_id_lists for doc_id in docs]
-
-    if not all_ids:
-        return None
-
-    counter = Counter(all_ids)
-    return counter.most_common(1)[0][0]
+    return _summarize_doc_ids(doc_id_lists)[1]
@@ -1,6 +1,6 @@
 """Membership inference metrics."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable
 
 from pydantic import BaseModel
 
@@ -16,8 +16,8 @@ class MembershipResult(BaseModel):
 
 
 def membership_confidence(
-    member_artifacts: Sequence[RunArtifact],
-    non_member_artifacts: Sequence[RunArtifact] | None = None,
+    member_artifacts: Iterable[RunArtifact],
+    non_member_artifacts: Iterable[RunArtifact] | None = None,
 ) -> MembershipResult:
     """Calculate membership inference confidence.
 
@@ -26,6 +26,9 @@ def membership_confidence(
     - Answer length (members may produce more detailed answers)
     - Context specificity
 
+    Both inputs are consumed once through MembershipAccumulator, so they
+    may be generators as well as lists.
+
     Args:
         member_artifacts: Artifacts from queries about known members.
         non_member_artifacts: Optional artifacts for non-members for comparison.
@@ -33,37 +36,76 @@ def membership_confidence(
     Returns:
         MembershipResult with confidence score.
     """
-    if not member_artifacts:
-        return MembershipResult(
-            score=0.0,
-            signal_strength=0.0,
-            artifacts_analyzed=0,
-        )
+    members = MembershipAccumulator()
+    for artifact in member_artifacts:
+        members.update(artifact)
 
-    # Calculate member signals
-    member_signals = [_calculate_signal(a) for a in member_artifacts]
-    avg_member_signal = sum(member_signals) / len(member_signals)
+    non_members = MembershipAccumulator()
+    for artifact in non_member_artifacts or ():
+        non_members.update(artifact)
 
-    if non_member_artifacts:
-        # Compare with non-members
-        non_member_signals = [_calculate_signal(a) for a in non_member_artifacts]
-        avg_non_member_signal = (
-            sum(non_member_signals) / len(non_member_signals) if non_member_signals else 0.0
-        )
-
-        # Score based on separation
-        signal_diff = avg_member_signal - avg_non_member_signal
-        # Normalize to 0-1 range (assuming max diff of 1.0)
-        score = max(0.0, min(1.0, 0.5 + signal_diff))
-    else:
+    if not non_members.count:
         # Without non-members, use absolute signal strength
-        score = avg_member_signal
+        return members.finalize()
+
+    # Compare with non-members
+    return members.finalize(baseline_signal=non_members.mean_signal)
+
 
-    return MembershipResult(
-        score=score,
-        signal_strength=avg_member_signal,
-        artifacts_analyzed=len(member_artifacts),
-    )
+class MembershipAccumulator:
+    """Online accumulator for membership confidence.
+
+    Lets callers fold artifacts in as they are produced (e.g. inside the
+    per-case metric loop) instead of sweeping the artifact list a second
+    time. ``finalize()`` gives the same result as membership_confidence().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.total_signal = 0.0
+        self.count = 0
+
+    def update(self, artifact: RunArtifact) -> None:
+        """Add one artifact's membership signal."""
+        self.total_signal += _calculate_signal(artifact)
+        self.count += 1
+
+    @property
+    def mean_signal(self) -> float:
+        """Average signal over the artifacts seen so far (0.0 if none)."""
+        return self.total_signal / self.count if self.count else 0.0
+
+    def finalize(self, baseline_signal: float | None = None) -> MembershipResult:
+        """Build the membership result.
+
+        Args:
+            baseline_signal: Optional average signal of non-member artifacts
+                to score against.
+
+        Returns:
+            MembershipResult with confidence score.
+        """
+        if not self.count:
+            return MembershipResult(
+                score=0.0,
+                signal_strength=0.0,
+                artifacts_analyzed=0,
+            )
+
+        avg_member_signal = self.mean_signal
+        if baseline_signal is None:
+            score = avg_member_signal
+        else:
+            # Score based on separation
+            signal_diff = avg_member_signal - baseline_signal
+            # Normalize to 0-1 range (assuming max diff of 1.0)
+            score = max(0.0, min(1.0, 0.5 + signal_diff))
+
+        return MembershipResult(
+            score=score,
+            signal_strength=avg_member_signal,
+            artifacts_analyzed=self.count,
+        )
 
 
 def _calculate_signal(artifact: RunArtifact) -> float:
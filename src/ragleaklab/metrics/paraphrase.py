@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 # Fixed paraphrase templates - deterministic, no ML
 PARAPHRASE_TEMPLATES = [
     # Original query
@@ -34,13 +36,13 @@ def generate_paraphrases(query: str, count: int = 5) -> list[str]:
         List of paraphrased queries including original.
     """
     count = min(count, len(PARAPHRASE_TEMPLATES))
+    return list(_generate_paraphrases_cached(query.strip(), count))
 
-    paraphrases = []
-    for template in PARAPHRASE_TEMPLATES[:count]:
-        paraphrased = template.format(query=query.strip())
-        paraphrases.append(paraphrased)
 
-    return paraphrases
+@lru_cache(maxsize=1024)
+def _generate_paraphrases_cached(query: str, count: int) -> tuple[str, ...]:
+    """Format the first count templates; memoized since probes repeat queries."""
+    return tuple(template.format(query=query) for template in PARAPHRASE_TEMPLATES[:count])
 
 
 def extract_query_topic(query: str) -> str:
@@ -0,0 +1,100 @@
+"""Per-answer metric scoring, optionally spread across worker processes."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from ragleaklab.metrics.canary import CanaryResult, detect_canary
+from ragleaklab.metrics.verbatim import VerbatimIndex, VerbatimResult, verbatim_overlap
+
+# Set in each worker process by _init_worker, so the index is pickled once
+# per worker instead of once per task
+_worker_index: VerbatimIndex | None = None
+
+# Answers handed to each worker per submitted window; bounds how far the
+# pool reads ahead of the consumer
+_WINDOW_PER_WORKER = 64
+
+
+def score_answer(answer: str, index: VerbatimIndex) -> tuple[CanaryResult, VerbatimResult]:
+    """Compute canary and verbatim metrics for one answer.
+
+    Args:
+        answer: Generated answer text.
+        index: Verbatim index over corpus sources.
+
+    Returns:
+        Tuple of (CanaryResult, VerbatimResult).
+    """
+    return detect_canary(answer), verbatim_overlap(answer, index)
+
+
+def score_answers(
+    answers: Iterable[str],
+    index: VerbatimIndex,
+    workers: int = 1,
+) -> list[tuple[CanaryResult, VerbatimResult]]:
+    """Compute canary and verbatim metrics for many answers.
+
+    Metrics are independent per answer and CPU-bound, so with workers > 1
+    they are computed in a process pool. Results keep the order of answers.
+
+    Args:
+        answers: Generated answer texts.
+        index: Verbatim index over corpus sources.
+        workers: Number of worker processes (1 = compute in-process).
+
+    Returns:
+        One (CanaryResult, VerbatimResult) tuple per answer.
+    """
+    return list(iter_scores(answers, index, workers=workers))
+
+
+def iter_scores(
+    answers: Iterable[str],
+    index: VerbatimIndex,
+    workers: int = 1,
+) -> Iterator[tuple[CanaryResult, VerbatimResult]]:
+    """Lazily compute canary and verbatim metrics for many answers.
+
+    Like score_answers(), but yields each result as soon as it is ready so
+    callers can consume results without holding all of them in memory. With
+    workers > 1, answers are submitted in windows, so at most one window of
+    answers is read ahead of the results consumed.
+
+    Args:
+        answers: Generated answer texts.
+        index: Verbatim index over corpus sources.
+        workers: Number of worker processes (1 = compute in-process).
+
+    Yields:
+        One (CanaryResult, VerbatimResult) tuple per answer, in order.
+    """
+    if workers <= 1:
+        for answer in answers:
+            yield score_answer(answer, index)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(index,),
+    ) as executor:
+        # executor.map submits all its inputs at once, so feed it one window
+        # at a time rather than the whole (possibly lazy) answer stream
+        answers = iter(answers)
+        window = workers * _WINDOW_PER_WORKER
+        while batch := list(islice(answers, window)):
+            yield from executor.map(_score_in_worker, batch, chunksize=16)
+
+
+def _init_worker(index: VerbatimIndex) -> None:
+    """Store the verbatim index in a worker process."""
+    global _worker_index
+    _worker_index = index
+
+
+def _score_in_worker(answer: str) -> tuple[CanaryResult, VerbatimResult]:
+    """Score an answer against the worker's verbatim index."""
+    assert _worker_index is not None
+    return score_answer(answer, _worker_index)
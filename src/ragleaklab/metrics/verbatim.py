@@ -1,12 +1,21 @@
 """Verbatim overlap metrics."""
 
 import re
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
 
-from pydantic import BaseModel
 
+class SourceDocument(Protocol):
+    """Anything with a document id and text, e.g. a corpus Document."""
 
-class VerbatimResult(BaseModel):
+    doc_id: str
+    text: str
+
+
+@dataclass(slots=True)
+class VerbatimResult:
     """Result of verbatim overlap detection."""
 
     score: float  # 0.0 - 1.0, highest overlap ratio
@@ -15,52 +24,176 @@ class VerbatimResult(BaseModel):
     ngram_matches: int  # Number of matching n-grams
 
 
-def _tokenize(text: str) -> list[str]:
-    """Simple word tokenization."""
-    return re.findall(r"\b\w+\b", text.lower())
+_WORD_PATTERN = re.compile(r"\b\w+\b")
+
+
+def _tokenize_lower(text_lower: str) -> list[str]:
+    """Word tokenization of already-lowercased text."""
+    return _WORD_PATTERN.findall(text_lower)
 
 
 def _get_ngrams(tokens: list[str], n: int) -> set[tuple[str, ...]]:
     """Generate n-grams from tokens."""
-    if len(tokens) < n:
-        return set()
-    return {tuple(tokens[i : i + n]) for i in range(len(tokens) - n + 1)}
+    # zip() over n shifted views builds each tuple in C, without a slice per n-gram
+    return set(zip(*(tokens[i:] for i in range(n)), strict=False))
+
+
+def _char_shingles(text: str, k: int) -> set[str]:
+    """Generate all k-character substrings of text."""
+    return {text[i : i + k] for i in range(len(text) - k + 1)}
+
+
+def _has_common_substring(short: str, long: str, length: int) -> bool:
+    """Check whether two strings share a substring of the given length."""
+    # Hash every window of the shorter string, probe with windows of the
+    # longer one; hash hits are confirmed by a real substring search
+    window_hashes = {hash(short[j : j + length]) for j in range(len(short) - length + 1)}
+    for i in range(len(long) - length + 1):
+        window = long[i : i + length]
+        if hash(window) in window_hashes and window in short:
+            return True
+    return False
+
+
+def _longest_common_substring_length(s1: str, s2: str, min_length: int = 1) -> int:
+    """Length of the longest common substring of two strings.
+
+    Having a common substring of length L implies one of every shorter
+    length, so the length is found by an exponential then binary search over
+    window sizes. Each probe is a linear scan of string slices done in C,
+    replacing the quadratic pure-Python DP.
+
+    Args:
+        s1: First string.
+        s2: Second string.
+        min_length: Lengths below this are not resolved; 0 is returned.
+
+    Returns:
+        Longest common substring length, or 0 if it is below min_length.
+    """
+    short, long = (s1, s2) if len(s1) <= len(s2) else (s2, s1)
+    min_length = max(min_length, 1)
+    if len(short) < min_length or not _has_common_substring(short, long, min_length):
+        return 0
 
+    # Invariant: a common substring of length lo exists, none of length hi.
+    # Probe cost grows with the window size and most answers share only
+    # short runs with a source, so gallop upward from min_length before
+    # bisecting instead of starting with a window half the text long
+    lo, hi = min_length, len(short) + 1
+    step = min_length
+    while lo + step < hi:
+        if not _has_common_substring(short, long, lo + step):
+            hi = lo + step
+            break
+        lo += step
+        step *= 2
 
-def _longest_common_substring(s1: str, s2: str) -> str:
-    """Find longest common substring between two strings."""
-    s1 = s1.lower()
-    s2 = s2.lower()
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _has_common_substring(short, long, mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
 
-    if not s1 or not s2:
-        return ""
 
-    # Dynamic programming approach
-    m, n = len(s1), len(s2)
-    # Use rolling array to save memory
-    prev = [0] * (n + 1)
-    curr = [0] * (n + 1)
+class VerbatimIndex:
+    """Source texts preprocessed once for repeated verbatim_overlap calls.
 
-    max_length = 0
-    end_pos = 0
+    Maps every source n-gram to the number of sources containing it, so an
+    answer's n-gram matches against all sources are counted in a single
+    pass over the answer instead of one set intersection per source.
+    Lowercased source texts are kept for LCS comparisons, along with an
+    inverted index from character shingles to the sources containing them:
+    a common substring of at least min_chars implies a shared shingle
+    whenever shingle_len <= min_chars, so only sources found through the
+    answer's shingles need the LCS at all.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[tuple[str, str]],
+        min_ngram_len: int = 4,
+        shingle_len: int = 8,
+    ):
+        """Build index from sources.
+
+        Args:
+            sources: (source_id, source_text) pairs; any iterable, consumed once.
+            min_ngram_len: N-gram size for matching.
+            shingle_len: Character shingle size for the LCS prefilter.
+        """
+        self.min_ngram_len = min_ngram_len
+        self.shingle_len = shingle_len
+        self.source_ids: list[str] = []
+        self.source_texts: list[str] = []
+        # Lowercased once here rather than on every LCS comparison
+        self.lowered_texts: list[str] = []
+        self.shingle_postings: dict[str, list[int]] = {}
+        self.ngram_source_counts: Counter[tuple[str, ...]] = Counter()
+
+        # Single pass over the sources fills every per-source structure
+        postings = self.shingle_postings
+        for source_idx, (source_id, source_text) in enumerate(sources):
+            lowered = source_text.lower()
+            self.source_ids.append(source_id)
+            self.source_texts.append(source_text)
+            self.lowered_texts.append(lowered)
+            for shingle in _char_shingles(lowered, shingle_len):
+                postings.setdefault(shingle, []).append(source_idx)
+            self.ngram_source_counts.update(_get_ngrams(_tokenize_lower(lowered), min_ngram_len))
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Iterable[SourceDocument],
+        min_ngram_len: int = 4,
+        shingle_len: int = 8,
+    ) -> "VerbatimIndex":
+        """Build index straight from documents with doc_id and text attributes.
+
+        Avoids materializing an intermediate list of (id, text) tuples.
+
+        Args:
+            documents: Documents, e.g. corpus Documents.
+            min_ngram_len: N-gram size for matching.
+            shingle_len: Character shingle size for the LCS prefilter.
+
+        Returns:
+            VerbatimIndex over the documents.
+        """
+        return cls(((d.doc_id, d.text) for d in documents), min_ngram_len, shingle_len)
 
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
-                curr[j] = prev[j - 1] + 1
-                if curr[j] > max_length:
-                    max_length = curr[j]
-                    end_pos = i
-            else:
-                curr[j] = 0
-        prev, curr = curr, prev
+    def __len__(self) -> int:
+        return len(self.source_ids)
 
-    return s1[end_pos - max_length : end_pos]
+    def candidate_sources(self, text_lower: str) -> list[int]:
+        """Indices of sources sharing at least one shingle with text, in order.
+
+        Args:
+            text_lower: Lowercased text to look up.
+
+        Returns:
+            Sorted source indices.
+        """
+        postings = self.shingle_postings
+        candidates: set[int] = set()
+        for shingle in _char_shingles(text_lower, self.shingle_len):
+            sources = postings.get(shingle)
+            if sources is not None:
+                candidates.update(sources)
+        return sorted(candidates)
+
+    def count_ngram_matches(self, ngrams: set[tuple[str, ...]]) -> int:
+        """Sum, over all sources, of n-grams shared with the given set."""
+        counts = self.ngram_source_counts
+        return sum(counts.get(ngram, 0) for ngram in ngrams)
 
 
 def verbatim_overlap(
     answer: str,
-    sources: Sequence[tuple[str, str]],  # List of (source_id, source_text)
+    sources: Sequence[tuple[str, str]] | VerbatimIndex,  # List of (source_id, source_text)
     min_chars: int = 20,
     min_ngram_len: int = 4,
 ) -> VerbatimResult:
@@ -70,12 +203,16 @@ def verbatim_overlap(
 
     Args:
         answer: Generated answer text.
-        sources: List of (source_id, source_text) tuples.
+        sources: List of (source_id, source_text) tuples, or a VerbatimIndex
+            built from them when scoring many answers against the same sources.
         min_chars: Minimum LCS length to count (reduces FP on common phrases).
         min_ngram_len: N-gram size for matching.
 
     Returns:
         VerbatimResult with overlap metrics.
+
+    Raises:
+        ValueError: If a VerbatimIndex was built with a different n-gram size.
     """
     if not answer or not sources:
         return VerbatimResult(
@@ -85,35 +222,58 @@ def verbatim_overlap(
             ngram_matches=0,
         )
 
-    answer_tokens = _tokenize(answer)
+    if isinstance(sources, VerbatimIndex):
+        if sources.min_ngram_len != min_ngram_len:
+            raise ValueError(
+                f"VerbatimIndex built with min_ngram_len={sources.min_ngram_len}, "
+                f"got {min_ngram_len}"
+            )
+        index = sources
+    else:
+        index = VerbatimIndex(sources, min_ngram_len)
+
+    answer_lower = answer.lower()
+    answer_tokens = _tokenize_lower(answer_lower)
     answer_ngrams = _get_ngrams(answer_tokens, min_ngram_len)
 
+    # Shingle prefilter is exact only if any qualifying LCS spans a full
+    # shingle; it replaces a scan over all sources with an index lookup
+    if index.shingle_len <= min_chars:
+        source_indices: Iterable[int] = index.candidate_sources(answer_lower)
+    else:
+        source_indices = range(len(index))
+
     max_score = 0.0
     max_lcs_length = 0
     max_source_id: str | None = None
-    total_ngram_matches = 0
 
-    for source_id, source_text in sources:
-        # LCS-based overlap
-        lcs = _longest_common_substring(answer, source_text)
-        lcs_length = len(lcs)
+    # Ascending source order keeps the first best source on ties
+    for source_idx in source_indices:
+        source_id = index.source_ids[source_idx]
+        source_text = index.source_texts[source_idx]
+        source_lower = index.lowered_texts[source_idx]
+        source_len = len(source_text)
+        # The LCS can be no longer than either text, which bounds the ratio
+        # this source can reach; skip it if that cannot qualify or beat the
+        # best source so far
+        lcs_bound = min(len(answer_lower), len(source_lower))
+        if lcs_bound < min_chars or source_len == 0 or lcs_bound / source_len <= max_score:
+            continue
+
+        # LCS-based overlap; lengths below min_chars never count
+        lcs_length = _longest_common_substring_length(answer_lower, source_lower, min_chars)
 
         # Only count if above minimum threshold
         if lcs_length >= min_chars:
             # Score as ratio of LCS to source length
-            source_len = len(source_text)
-            if source_len > 0:
-                ratio = lcs_length / source_len
-                if ratio > max_score:
-                    max_score = ratio
-                    max_lcs_length = lcs_length
-                    max_source_id = source_id
-
-        # N-gram overlap
-        source_tokens = _tokenize(source_text)
-        source_ngrams = _get_ngrams(source_tokens, min_ngram_len)
-        ngram_overlap = len(answer_ngrams & source_ngrams)
-        total_ngram_matches += ngram_overlap
+            ratio = lcs_length / source_len
+            if ratio > max_score:
+                max_score = ratio
+                max_lcs_length = lcs_length
+                max_source_id = source_id
+
+    # N-gram overlap: one lookup per answer n-gram across all sources
+    total_ngram_matches = index.count_ngram_matches(answer_ngrams)
 
     return VerbatimResult(
         score=min(max_score, 1.0),  # Cap at 1.0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 # Current pack version
@@ -13,16 +14,22 @@ AVAILABLE_PACKS = [
     "verbatim-basic",
     "membership-basic",
 ]
+# Set view for membership checks; AVAILABLE_PACKS keeps the listing order
+_PACK_NAMES = frozenset(AVAILABLE_PACKS)
 
 
+@lru_cache(maxsize=1)
 def _get_packs_dir() -> Path:
     """Get the directory containing pack files."""
     return Path(__file__).parent
 
 
+@lru_cache(maxsize=64)
 def get_pack_path(pack_name: str, version: str | None = None) -> Path:
     """Get the path to a built-in pack.
 
+    Resolved paths are memoized, so repeated lookups skip the existence check.
+
     Args:
         pack_name: Name of the pack (e.g., 'canary-basic').
         version: Pack version (default: current version).
@@ -35,7 +42,7 @@ def get_pack_path(pack_name: str, version: str | None = None) -> Path:
     """
     version = version or PACK_VERSION
 
-    if pack_name not in AVAILABLE_PACKS:
+    if pack_name not in _PACK_NAMES:
         available = ", ".join(AVAILABLE_PACKS)
         msg = f"Unknown pack '{pack_name}'. Available: {available}"
         raise ValueError(msg)
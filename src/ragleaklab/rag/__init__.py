@@ -1,5 +1,6 @@
 """RAG module for reference pipeline implementation."""
 
+from ragleaklab.rag.cache import corpus_fingerprint, load_or_build_retriever
 from ragleaklab.rag.context import ContextBuilder
 from ragleaklab.rag.generator import MockGenerator
 from ragleaklab.rag.pipeline import RAGPipeline
@@ -14,4 +15,6 @@ __all__ = [
     "RAGPipeline",
     "RetrievalResult",
     "TFIDFRetriever",
+    "corpus_fingerprint",
+    "load_or_build_retriever",
 ]
@@ -0,0 +1,89 @@
+"""On-disk cache for built retrieval indexes."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from ragleaklab.rag.retriever import TFIDFRetriever
+from ragleaklab.rag.types import Document
+
+# Bump when the pickled retriever state changes shape
+CACHE_FORMAT_VERSION = 7
+
+
+def corpus_fingerprint(
+    documents: list[Document],
+    chunk_size: int = 256,
+    chunk_overlap: int = 32,
+) -> str:
+    """Compute a stable hash of a corpus and its indexing parameters.
+
+    Args:
+        documents: Documents to index.
+        chunk_size: Retriever chunk size.
+        chunk_overlap: Retriever chunk overlap.
+
+    Returns:
+        Hex digest identifying the index that would be built.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_FORMAT_VERSION}:{chunk_size}:{chunk_overlap}".encode())
+    for doc in documents:
+        # Length-prefix fields so that boundaries cannot be shifted
+        for field in (doc.doc_id, doc.text):
+            data = field.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def load_or_build_retriever(
+    documents: list[Document],
+    cache_dir: Path,
+    chunk_size: int = 256,
+    chunk_overlap: int = 32,
+) -> TFIDFRetriever:
+    """Load a TF-IDF index for documents from cache_dir, building it on a miss.
+
+    Indexes are keyed by corpus_fingerprint(), so repeated runs over an
+    unchanged corpus (e.g. CI regression checks) skip chunking and TF-IDF
+    computation. Unreadable cache entries are rebuilt and overwritten.
+
+    Cache entries are pickles, and loading a pickle can execute arbitrary
+    code, so cache_dir must only be writable by trusted users.
+
+    Args:
+        documents: Documents to index.
+        cache_dir: Directory holding cached indexes.
+        chunk_size: Retriever chunk size.
+        chunk_overlap: Retriever chunk overlap.
+
+    Returns:
+        Indexed TFIDFRetriever.
+    """
+    key = corpus_fingerprint(documents, chunk_size, chunk_overlap)
+    cache_path = Path(cache_dir) / f"tfidf-{key}.pkl"
+
+    if cache_path.is_file():
+        try:
+            with open(cache_path, "rb") as f:
+                retriever = pickle.load(f)
+            if isinstance(retriever, TFIDFRetriever):
+                return retriever
+        except Exception:
+            # Stale or malformed pickles can raise almost anything (e.g. a
+            # moved module surfaces as ImportError); treat all as a miss
+            pass
+
+    retriever = TFIDFRetriever(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    retriever.add_documents(documents)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent runs never read a partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(retriever, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(cache_path)
+
+    return retriever
@@ -1,7 +1,11 @@
 """Context builder for RAG pipeline."""
 
+import re
+
 from ragleaklab.rag.types import Chunk
 
+_CHUNK_LABEL_PATTERN = re.compile(r"\[([^\]]+:[^\]]+)\]")
+
 
 class ContextBuilder:
     """Builds formatted context from retrieved chunks."""
@@ -42,7 +46,4 @@ class ContextBuilder:
         Returns:
             List of chunk IDs in order of appearance.
         """
-        import re
-
-        pattern = r"\[([^\]]+:[^\]]+)\]"
-        return re.findall(pattern, context)
+        return _CHUNK_LABEL_PATTERN.findall(context)
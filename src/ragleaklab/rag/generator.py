@@ -1,6 +1,33 @@
 """Mock generator for deterministic RAG testing."""
 
+import heapq
 import re
+from functools import lru_cache
+
+_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+# Chunk labels [doc_id:chunk_id] or separator lines between chunks
+_LABEL_OR_SEPARATOR_PATTERN = re.compile(r"\[[^\]]+:[^\]]+\]|\n---\n")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def _strip_label_or_separator(match: re.Match[str]) -> str:
+    """Drop chunk labels and turn separator lines into a space."""
+    return " " if match.group() == "\n---\n" else ""
+
+
+@lru_cache(maxsize=128)
+def _split_context(context: str) -> tuple[tuple[str, ...], tuple[frozenset[str], ...]]:
+    """Sentences of a context and the lowercased keyword set of each.
+
+    Memoized because the same top-k chunks, and so the same context, come
+    back for many queries of a run.
+    """
+    # Remove chunk labels and separator lines in a single pass
+    clean_text = _LABEL_OR_SEPARATOR_PATTERN.sub(_strip_label_or_separator, context)
+    # Split into sentences (simple split on period, !, ?), dropping empty ones
+    sentences = tuple(s for s in map(str.strip, _SENTENCE_SPLIT_PATTERN.split(clean_text)) if s)
+    keywords = tuple(frozenset(_TOKEN_PATTERN.findall(s.lower())) for s in sentences)
+    return sentences, keywords
 
 
 class MockGenerator:
@@ -37,27 +64,24 @@ class MockGenerator:
             return "No context provided."
 
         # Extract sentences from context (skip chunk labels)
-        sentences = self._extract_sentences(context)
+        sentences, sentence_keyword_sets = _split_context(context)
         if not sentences:
             return "No relevant content found in context."
 
         # Score sentences by keyword overlap
-        query_keywords = set(self._tokenize(query))
-        scored: list[tuple[str, float, int]] = []
-
-        for idx, sentence in enumerate(sentences):
-            sentence_keywords = set(self._tokenize(sentence))
-            overlap = len(query_keywords & sentence_keywords)
-            # Normalize by sentence length to avoid bias toward long sentences
-            score = overlap / max(len(sentence_keywords), 1)
-            # Tie-breaker: original order (idx)
-            scored.append((sentence, score, idx))
+        query_keywords = frozenset(self._tokenize(query))
+        scored: list[tuple[float, int]] = []
 
-        # Sort by score (desc), then by index (asc) for determinism
-        scored.sort(key=lambda x: (-x[1], x[2]))
+        for idx, sentence_keywords in enumerate(sentence_keyword_sets):
+            overlap = len(sentence_keywords & query_keywords)
+            # Sentences without overlap are never selected
+            if overlap:
+                # Normalize by sentence length to avoid bias toward long sentences
+                scored.append((overlap / len(sentence_keywords), idx))
 
-        # Take top sentences
-        top_sentences = [s[0] for s in scored[: self.max_sentences] if s[1] > 0]
+        # Top sentences by score (desc), then by index (asc) for determinism
+        top = heapq.nsmallest(self.max_sentences, scored, key=lambda x: (-x[0], x[1]))
+        top_sentences = [sentences[idx] for _, idx in top]
 
         if not top_sentences:
             # Fallback: return first sentence from context
@@ -67,16 +91,8 @@ class MockGenerator:
 
     def _extract_sentences(self, context: str) -> list[str]:
         """Extract sentences from context, skipping chunk labels."""
-        # Remove chunk labels [doc_id:chunk_id]
-        clean_text = re.sub(r"\[[^\]]+:[^\]]+\]", "", context)
-        # Remove separator lines
-        clean_text = re.sub(r"\n---\n", " ", clean_text)
-        # Split into sentences (simple split on period, !, ?)
-        sentences = re.split(r"(?<=[.!?])\s+", clean_text)
-        # Clean up and filter empty
-        sentences = [s.strip() for s in sentences if s.strip()]
-        return sentences
+        return list(_split_context(context)[0])
 
     def _tokenize(self, text: str) -> list[str]:
         """Simple tokenizer: lowercase, alphanumeric only."""
-        return re.findall(r"\b\w+\b", text.lower())
+        return _TOKEN_PATTERN.findall(text.lower())
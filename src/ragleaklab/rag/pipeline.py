@@ -8,7 +8,7 @@ from ragleaklab.rag.retriever import TFIDFRetriever
 from ragleaklab.rag.types import Chunk, Document
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result from RAG pipeline run."""
 
@@ -59,19 +59,39 @@ class RAGPipeline:
         Returns:
             PipelineResult with answer, retrieved chunks, and context.
         """
-        # 1. Retrieve relevant chunks
-        retrieval_result = self.retriever.retrieve(query, top_k=self.top_k)
-
-        # 2. Build context
-        context = self.context_builder.build(retrieval_result.chunks)
-
-        # 3. Generate answer
-        answer = self.generator.generate(query, context)
-
-        return PipelineResult(
-            query=query,
-            answer=answer,
-            retrieved_chunks=retrieval_result.chunks,
-            context=context,
-            scores=retrieval_result.scores,
-        )
+        return self.run_batch([query])[0]
+
+    def run_batch(self, queries: list[str]) -> list[PipelineResult]:
+        """Run the full RAG pipeline for several queries.
+
+        Retrieval for all queries is done in a single pass over the index;
+        context building and generation then run per query.
+
+        Args:
+            queries: User queries.
+
+        Returns:
+            One PipelineResult per query, in input order.
+        """
+        # 1. Retrieve relevant chunks for all queries at once
+        retrieval_results = self.retriever.retrieve_batch(queries, top_k=self.top_k)
+
+        results = []
+        for query, retrieval_result in zip(queries, retrieval_results, strict=True):
+            # 2. Build context
+            context = self.context_builder.build(retrieval_result.chunks)
+
+            # 3. Generate answer
+            answer = self.generator.generate(query, context)
+
+            results.append(
+                PipelineResult(
+                    query=query,
+                    answer=answer,
+                    retrieved_chunks=retrieval_result.chunks,
+                    context=context,
+                    scores=retrieval_result.scores,
+                )
+            )
+
+        return results
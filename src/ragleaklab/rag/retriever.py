@@ -1,15 +1,21 @@
 """Deterministic TF-IDF based retriever."""
 
+import heapq
 import math
 import re
+import sys
 from collections import Counter
 
 from ragleaklab.rag.types import Chunk, Document, RetrievalResult
 
+_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+# Query vectors kept per retriever; paraphrase probes repeat the same queries
+_QUERY_CACHE_SIZE = 256
+
 
 def tokenize(text: str) -> list[str]:
     """Simple tokenizer: lowercase, split on non-alphanumeric."""
-    return re.findall(r"\b\w+\b", text.lower())
+    return _TOKEN_PATTERN.findall(text.lower())
 
 
 class TFIDFRetriever:
@@ -20,72 +26,98 @@ class TFIDFRetriever:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.chunks: list[Chunk] = []
+        # Term counts per chunk, kept so re-indexing never re-tokenizes
+        self.chunk_term_counts: list[Counter[str]] = []
         self.doc_freqs: Counter[str] = Counter()
+        self.idf: dict[str, float] = {}
         self.chunk_vectors: list[dict[str, float]] = []
+        # Parallel to chunks/chunk_vectors, so ranking reads flat lists
+        self.chunk_full_ids: list[str] = []
+        self.chunk_norms: list[float] = []
+        # Inverted index: term -> (chunk index, weight) for chunks containing it
+        self.postings: dict[str, list[tuple[int, float]]] = {}
+        # Chunk indices sorted by full_id, for ranking chunks sharing no term
+        self.chunk_id_order: list[int] = []
+        # Query vectors depend on doc_freqs, so _build_index clears this
+        self._query_vector_cache: dict[str, dict[str, float]] = {}
         self._indexed = False
 
     def add_documents(self, documents: list[Document]) -> None:
-        """Add documents to the index, chunking them first."""
+        """Add documents to the index, chunking them first.
+
+        Only the new chunks are tokenized and counted into document
+        frequencies; weights for all chunks are then recomputed, since IDF
+        depends on the total chunk count.
+        """
         for doc in documents:
-            doc_chunks = self._chunk_document(doc)
-            self.chunks.extend(doc_chunks)
+            for chunk in self._chunk_document(doc):
+                # Tokenize each chunk once; term counts feed both DF and TF
+                term_counts = Counter(tokenize(chunk.text))
+                self.chunks.append(chunk)
+                self.chunk_term_counts.append(term_counts)
+                self.doc_freqs.update(term_counts.keys())
         self._build_index()
 
     def _chunk_document(self, doc: Document) -> list[Chunk]:
-        """Split document into chunks."""
-        text = doc.text
-        chunks = []
-        start = 0
-        chunk_idx = 0
-
-        while start < len(text):
-            end = min(start + self.chunk_size, len(text))
-            chunk_text = text[start:end]
-
-            chunks.append(
-                Chunk(
-                    doc_id=doc.doc_id,
-                    chunk_id=f"c{chunk_idx}",
-                    text=chunk_text,
-                )
-            )
-
-            start += self.chunk_size - self.chunk_overlap
-            chunk_idx += 1
+        """Split document into chunks.
 
-            if start >= len(text):
-                break
+        Raises:
+            ValueError: If chunk_overlap is not smaller than chunk_size.
+        """
+        step = self.chunk_size - self.chunk_overlap
+        if step <= 0:
+            raise ValueError(
+                f"chunk_overlap ({self.chunk_overlap}) must be smaller than "
+                f"chunk_size ({self.chunk_size})"
+            )
 
-        return chunks
+        text = doc.text
+        doc_id = doc.doc_id
+        size = self.chunk_size
+        # Fields are already strings, so skip per-chunk validation
+        return [
+            Chunk.model_construct(
+                doc_id=doc_id, chunk_id=f"c{chunk_idx}", text=text[start : start + size]
+            )
+            for chunk_idx, start in enumerate(range(0, len(text), step))
+        ]
 
     def _build_index(self) -> None:
-        """Build TF-IDF index from chunks."""
-        # Count document frequencies
-        self.doc_freqs = Counter()
-        for chunk in self.chunks:
-            tokens = set(tokenize(chunk.text))
-            for token in tokens:
-                self.doc_freqs[token] += 1
+        """Build TF-IDF index from chunk term counts and document frequencies."""
+        # IDF: log(N / df), computed once per term rather than per occurrence
+        n_docs = len(self.chunks)
+        self.idf = {token: math.log(n_docs / df) for token, df in self.doc_freqs.items()}
 
         # Build TF-IDF vectors for each chunk
-        n_docs = len(self.chunks)
+        idf = self.idf
         self.chunk_vectors = []
 
-        for chunk in self.chunks:
-            tokens = tokenize(chunk.text)
-            tf = Counter(tokens)
+        for tf in self.chunk_term_counts:
             vector: dict[str, float] = {}
 
             for token, count in tf.items():
                 # TF: log(1 + count)
-                tf_score = math.log1p(count)
-                # IDF: log(N / df)
-                df = self.doc_freqs.get(token, 1)
-                idf = math.log(n_docs / df) if df > 0 else 0
-                vector[token] = tf_score * idf
+                weight = math.log1p(count) * idf[token]
+                # Zero weights (terms in every chunk) add nothing to dot
+                # products or norms, so keep vectors sparse
+                if weight:
+                    # Interned keys are shared across all chunk vectors
+                    vector[sys.intern(token)] = weight
 
             self.chunk_vectors.append(vector)
 
+        self.postings = {}
+        for chunk_idx, vector in enumerate(self.chunk_vectors):
+            for token, weight in vector.items():
+                self.postings.setdefault(token, []).append((chunk_idx, weight))
+
+        self.chunk_full_ids = [chunk.full_id for chunk in self.chunks]
+        self.chunk_id_order = sorted(
+            range(len(self.chunk_full_ids)), key=self.chunk_full_ids.__getitem__
+        )
+        # Chunk norms never change after indexing, so queries reuse them
+        self.chunk_norms = [_magnitude(vector) for vector in self.chunk_vectors]
+        self._query_vector_cache = {}
         self._indexed = True
 
     def retrieve(self, query: str, top_k: int = 5) -> RetrievalResult:
@@ -93,55 +125,107 @@ class TFIDFRetriever:
 
         Uses TF-IDF cosine similarity with deterministic tie-breaking.
         """
-        if not self._indexed:
-            return RetrievalResult(chunks=[], scores=[], query=query)
+        return self.retrieve_batch([query], top_k=top_k)[0]
 
-        # Build query vector
-        query_tokens = tokenize(query)
-        query_tf = Counter(query_tokens)
-        n_docs = len(self.chunks)
-
-        query_vector: dict[str, float] = {}
-        for token, count in query_tf.items():
-            tf_score = math.log1p(count)
-            df = self.doc_freqs.get(token, 1)
-            idf = math.log(n_docs / df) if df > 0 else 0
-            query_vector[token] = tf_score * idf
+    def retrieve_batch(self, queries: list[str], top_k: int = 5) -> list[RetrievalResult]:
+        """Retrieve top-k chunks for several queries.
 
-        # Calculate similarities
-        scores: list[tuple[int, float, str]] = []
-        for idx, chunk_vector in enumerate(self.chunk_vectors):
-            sim = self._cosine_similarity(query_vector, chunk_vector)
-            # Tie-breaker: chunk full_id for deterministic ordering
-            scores.append((idx, sim, self.chunks[idx].full_id))
+        Similarities are accumulated through the inverted index, so only
+        chunks sharing a term with a query are scored. Duplicate queries are
+        vectorized and scored only once. Results are identical to calling
+        retrieve() for each query.
 
-        # Sort by score (descending), then by chunk_id (ascending) for ties
-        scores.sort(key=lambda x: (-x[1], x[2]))
+        Args:
+            queries: Queries to retrieve for.
+            top_k: Number of chunks to return per query.
 
-        # Take top-k
-        top_indices = [s[0] for s in scores[:top_k]]
-        top_scores = [s[1] for s in scores[:top_k]]
+        Returns:
+            One RetrievalResult per query, in input order.
+        """
+        if not self._indexed:
+            return [RetrievalResult(chunks=[], scores=[], query=q) for q in queries]
+
+        # Vectorize each distinct query once; attack suites often repeat queries
+        unique_queries = list(dict.fromkeys(queries))
+        sims_by_query = {
+            query: self._similarities(self._query_vector(query)) for query in unique_queries
+        }
+        return [self._rank(query, sims_by_query[query], top_k) for query in queries]
+
+    def _query_vector(self, query: str) -> dict[str, float]:
+        """TF-IDF vector for a query, cached until the index is rebuilt."""
+        cache = self._query_vector_cache
+        vector = cache.get(query)
+        if vector is None:
+            if len(cache) >= _QUERY_CACHE_SIZE:
+                # Evict the oldest entry
+                del cache[next(iter(cache))]
+            vector = cache[query] = self._build_query_vector(query)
+        return vector
+
+    def _build_query_vector(self, query: str) -> dict[str, float]:
+        """Build TF-IDF vector for a query."""
+        query_tf = Counter(tokenize(query))
+        idf = self.idf
+        # Terms unseen in the index get the IDF of a single-chunk term; an
+        # index without chunks has nothing to match either way
+        unseen_idf = math.log(len(self.chunks)) if self.chunks else 0.0
+
+        return {
+            token: math.log1p(count) * idf.get(token, unseen_idf)
+            for token, count in query_tf.items()
+        }
+
+    def _rank(self, query: str, sims: dict[int, float], top_k: int) -> RetrievalResult:
+        """Select top-k chunks from sparse per-chunk similarities."""
+        # Top-k by score (descending), then by chunk full_id (ascending) for
+        # deterministic tie-breaking, then by index as a stable sort would; a
+        # bounded heap avoids sorting every scored chunk
+        full_ids = self.chunk_full_ids
+        positive = [i for i, sim in sims.items() if sim > 0.0]
+        top_indices = heapq.nsmallest(top_k, positive, key=lambda i: (-sims[i], full_ids[i], i))
+
+        # Every other chunk scores 0.0 and ranks by full_id alone
+        if len(top_indices) < top_k:
+            for i in self.chunk_id_order:
+                if sims.get(i, 0.0) <= 0.0:
+                    top_indices.append(i)
+                    if len(top_indices) == top_k:
+                        break
 
         return RetrievalResult(
             chunks=[self.chunks[i] for i in top_indices],
-            scores=top_scores,
+            scores=[sims.get(i, 0.0) for i in top_indices],
             query=query,
         )
 
-    def _cosine_similarity(self, vec1: dict[str, float], vec2: dict[str, float]) -> float:
-        """Calculate cosine similarity between two sparse vectors."""
-        if not vec1 or not vec2:
-            return 0.0
+    def _similarities(self, query_vector: dict[str, float]) -> dict[int, float]:
+        """Cosine similarity of a query vector to the chunks sharing a term with it.
+
+        Dot products are accumulated term by term from the postings, in
+        query-term order, so they equal a full per-chunk dot product; chunks
+        absent from the result have similarity 0.0.
+
+        Args:
+            query_vector: Sparse TF-IDF query vector.
+
+        Returns:
+            Map from chunk index to similarity.
+        """
+        query_mag = _magnitude(query_vector)
+        if not query_mag:
+            return {}
 
-        # Dot product
-        common_keys = set(vec1.keys()) & set(vec2.keys())
-        dot = sum(vec1[k] * vec2[k] for k in common_keys)
+        postings = self.postings
+        dots: dict[int, float] = {}
+        for token, weight in query_vector.items():
+            for chunk_idx, chunk_weight in postings.get(token, ()):
+                dots[chunk_idx] = dots.get(chunk_idx, 0.0) + weight * chunk_weight
 
-        # Magnitudes
-        mag1 = math.sqrt(sum(v * v for v in vec1.values()))
-        mag2 = math.sqrt(sum(v * v for v in vec2.values()))
+        norms = self.chunk_norms
+        return {i: dot / (query_mag * norms[i]) for i, dot in dots.items()}
 
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
 
-        return dot / (mag1 * mag2)
+def _magnitude(vector: dict[str, float]) -> float:
+    """Euclidean norm of a sparse vector."""
+    return math.sqrt(sum(v * v for v in vector.values()))
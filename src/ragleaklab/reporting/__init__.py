@@ -1,6 +1,9 @@
 """Reporting module for generating output files."""
 
 from ragleaklab.reporting.export import (
+    JsonlWriter,
+    export_json,
+    export_jsonl,
     export_junit,
     export_sarif,
 )
@@ -13,7 +16,10 @@ from ragleaklab.reporting.schema import (
 __all__ = [
     "CaseResult",
     "FailureReason",
+    "JsonlWriter",
     "Report",
+    "export_json",
+    "export_jsonl",
     "export_junit",
     "export_sarif",
 ]
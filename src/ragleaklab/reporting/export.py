@@ -3,13 +3,86 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TextIO
 from xml.etree import ElementTree as ET
 
-if TYPE_CHECKING:
-    from ragleaklab.reporting.schema import CaseResult, Report
+from pydantic import TypeAdapter
+
+from ragleaklab.reporting.schema import CaseResult, Report
+
+# Serializers built once and reused, emitting bytes directly
+_CASE_RESULT_ADAPTER = TypeAdapter(CaseResult)
+_REPORT_ADAPTER = TypeAdapter(Report)
+
+
+def export_json(
+    report: Report,
+    output_path: Path,
+    indent: int | None = 2,
+) -> None:
+    """Export the aggregated report as JSON.
+
+    The report is serialized straight to bytes and written in one call.
+
+    Args:
+        report: The aggregated report.
+        output_path: Path to write report.json.
+        indent: Indentation level, or None for compact output.
+    """
+    output_path.write_bytes(_REPORT_ADAPTER.dump_json(report, indent=indent))
+
+
+def export_jsonl(
+    case_results: Iterable[CaseResult],
+    output_path: Path,
+) -> None:
+    """Export per-case results as JSON Lines.
+
+    Lines are serialized straight to bytes and written through a large
+    buffer, so big runs do not pay a syscall or string copy per case.
+
+    Args:
+        case_results: Per-case results.
+        output_path: Path to write runs.jsonl.
+    """
+    with JsonlWriter(output_path) as writer:
+        for case in case_results:
+            writer.write(case)
+
+
+class JsonlWriter:
+    """Incremental JSON Lines writer for per-case results.
+
+    Lets callers write each case as soon as it is scored instead of
+    collecting all results before export_jsonl().
+    """
+
+    def __init__(self, output_path: Path):
+        """Open output_path for writing.
+
+        Args:
+            output_path: Path to write runs.jsonl.
+        """
+        self.output_path = output_path
+        self._file = open(output_path, "wb", buffering=1 << 20)
+
+    def write(self, case: CaseResult) -> None:
+        """Append one case result as a line."""
+        # One buffered write per line
+        self._file.write(_CASE_RESULT_ADAPTER.dump_json(case) + b"\n")
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> JsonlWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def export_junit(
@@ -20,61 +93,75 @@ def export_junit(
     """Export report as JUnit XML.
 
     Test runners (pytest, GitHub Actions) display failures as test results.
+    Test cases are serialized and written one at a time rather than built
+    into a single in-memory tree.
 
     Args:
         report: The aggregated report.
         case_results: Per-case results.
         output_path: Path to write junit.xml.
     """
-    # Create testsuite element
-    testsuite = ET.Element("testsuite")
-    testsuite.set("name", "RAGLeakLab Security Audit")
-    testsuite.set("tests", str(len(case_results)))
-    testsuite.set("timestamp", datetime.now(UTC).isoformat())
+    # Failure messages are needed up front for the suite's failure count
+    case_failures = [_junit_case_failure(case) for case in case_results]
+    failures = sum(message is not None for message in case_failures) + len(report.failures)
 
-    failures = 0
-    for case in case_results:
-        testcase = ET.SubElement(testsuite, "testcase")
-        testcase.set("name", f"{case.threat}:{case.test_id}")
-        testcase.set("classname", f"ragleaklab.{case.threat}")
+    # Suite attributes are plain names and numbers, so need no escaping
+    suite_attrs = (
+        f'name="RAGLeakLab Security Audit" tests="{len(case_results)}" '
+        f'timestamp="{datetime.now(UTC).isoformat()}" failures="{failures}" errors="0"'
+    )
 
-        # Determine if this case is a failure
-        is_failure = False
-        failure_message = ""
+    with open(output_path, "w", encoding="utf-8", errors="xmlcharrefreplace") as f:
+        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        if not case_results and not report.failures:
+            f.write(f"<testsuite {suite_attrs} />")
+            return
+
+        f.write(f"<testsuite {suite_attrs}>")
+
+        for case, failure_message in zip(case_results, case_failures, strict=True):
+            testcase = ET.Element("testcase")
+            testcase.set("name", f"{case.threat}:{case.test_id}")
+            testcase.set("classname", f"ragleaklab.{case.threat}")
+
+            if failure_message is not None:
+                failure_elem = ET.SubElement(testcase, "failure")
+                failure_elem.set("message", failure_message)
+                failure_elem.set("type", case.threat)
+                failure_elem.text = f"Query: {case.query}\nAnswer: {case.answer[:200]}..."
+
+            _write_junit_testcase(f, testcase)
+
+        # Add overall failures from report
+        for failure in report.failures:
+            testcase = ET.Element("testcase")
+            testcase.set("name", f"aggregate:{failure.threat}")
+            testcase.set("classname", "ragleaklab.aggregate")
 
-        if case.canary_detected:
-            is_failure = True
-            failure_message = f"Canary extracted ({case.canary_count} tokens)"
-        elif case.verbatim_score > 0.1:  # High verbatim
-            is_failure = True
-            failure_message = f"High verbatim overlap: {case.verbatim_score:.2%}"
-
-        if is_failure:
-            failures += 1
             failure_elem = ET.SubElement(testcase, "failure")
-            failure_elem.set("message", failure_message)
-            failure_elem.set("type", case.threat)
-            failure_elem.text = f"Query: {case.query}\nAnswer: {case.answer[:200]}..."
+            failure_elem.set("message", failure.reason)
+            failure_elem.set("type", failure.threat)
+            failure_elem.text = f"Value: {failure.value}, Threshold: {failure.threshold}"
+
+            _write_junit_testcase(f, testcase)
+
+        f.write("\n</testsuite>")
 
-    # Add overall failures from report
-    for failure in report.failures:
-        testcase = ET.SubElement(testsuite, "testcase")
-        testcase.set("name", f"aggregate:{failure.threat}")
-        testcase.set("classname", "ragleaklab.aggregate")
 
-        failure_elem = ET.SubElement(testcase, "failure")
-        failure_elem.set("message", failure.reason)
-        failure_elem.set("type", failure.threat)
-        failure_elem.text = f"Value: {failure.value}, Threshold: {failure.threshold}"
-        failures += 1
+def _junit_case_failure(case: CaseResult) -> str | None:
+    """Failure message for a case, or None if it passed."""
+    if case.canary_detected:
+        return f"Canary extracted ({case.canary_count} tokens)"
+    if case.verbatim_score > 0.1:  # High verbatim
+        return f"High verbatim overlap: {case.verbatim_score:.2%}"
+    return None
 
-    testsuite.set("failures", str(failures))
-    testsuite.set("errors", "0")
 
-    # Write XML
-    tree = ET.ElementTree(testsuite)
-    ET.indent(tree, space="  ")
-    tree.write(output_path, encoding="unicode", xml_declaration=True)
+def _write_junit_testcase(f: TextIO, testcase: ET.Element) -> None:
+    """Write one indented testcase element inside the testsuite."""
+    ET.indent(testcase, space="  ", level=1)
+    f.write("\n  ")
+    f.write(ET.tostring(testcase, encoding="unicode"))
 
 
 def export_sarif(
@@ -85,6 +172,8 @@ def export_sarif(
     """Export report as SARIF for GitHub Security.
 
     GitHub code scanning displays findings as security alerts.
+    Results are serialized and written one at a time rather than collected
+    into a single document; the output matches serializing it whole.
 
     Args:
         report: The aggregated report.
@@ -101,123 +190,135 @@ def export_sarif(
                         "name": "RAGLeakLab",
                         "informationUri": "https://github.com/mishabar410/RAGLeakLab",
                         "version": "0.1.0",
-                        "rules": _build_sarif_rules(),
+                        "rules": _SARIF_RULES,
                     }
                 },
-                "results": _build_sarif_results(report, case_results),
+                "results": [],
             }
         ],
     }
 
-    output_path.write_text(json.dumps(sarif, indent=2))
+    # Split the indented skeleton around the empty results array, then stream
+    # each result between the halves at the array's nesting depth. Stdlib json
+    # keeps the ASCII-only escaping SARIF files have always been written with
+    head, tail = json.dumps(sarif, indent=2).split('"results": []')
+    with open(output_path, "w", encoding="ascii") as f:
+        f.write(head)
+        f.write('"results": [')
+        separator = _SARIF_RESULT_INDENT
+        for result in _iter_sarif_results(report, case_results):
+            f.write(separator)
+            f.write(json.dumps(result, indent=2).replace("\n", _SARIF_RESULT_INDENT))
+            separator = "," + _SARIF_RESULT_INDENT
+        if separator != _SARIF_RESULT_INDENT:
+            f.write("\n      ")
+        f.write("]")
+        f.write(tail)
 
 
-def _build_sarif_rules() -> list[dict]:
-    """Build SARIF rule definitions."""
-    return [
-        {
-            "id": "canary-extraction",
-            "name": "CanaryExtraction",
-            "shortDescription": {"text": "Canary token extracted from RAG output"},
-            "fullDescription": {
-                "text": "A planted secret token was found in the RAG system output, "
-                "indicating direct memorization of private corpus content."
-            },
-            "defaultConfiguration": {"level": "error"},
-            "properties": {"security-severity": "9.0"},
-        },
-        {
-            "id": "verbatim-leakage",
-            "name": "VerbatimLeakage",
-            "shortDescription": {"text": "High verbatim text reproduction"},
-            "fullDescription": {
-                "text": "The RAG output contains significant verbatim reproduction of "
-                "private corpus content, indicating potential data leakage."
-            },
-            "defaultConfiguration": {"level": "warning"},
-            "properties": {"security-severity": "7.0"},
-        },
-        {
-            "id": "membership-inference",
-            "name": "MembershipInference",
-            "shortDescription": {"text": "Document membership can be inferred"},
-            "fullDescription": {
-                "text": "The RAG system behavior allows inference of whether "
-                "specific documents were in the training corpus."
-            },
-            "defaultConfiguration": {"level": "warning"},
-            "properties": {"security-severity": "5.0"},
-        },
-    ]
-
+# Newline plus indentation of entries in runs[0].results
+_SARIF_RESULT_INDENT = "\n" + " " * 8
 
-def _build_sarif_results(report: Report, case_results: list[CaseResult]) -> list[dict]:
-    """Build SARIF results from report."""
-    results = []
 
+def _iter_sarif_results(report: Report, case_results: Iterable[CaseResult]) -> Iterator[dict]:
+    """Yield SARIF results for per-case and aggregate findings."""
     # Add per-case findings
     for case in case_results:
         if case.canary_detected:
-            results.append(
-                {
-                    "ruleId": "canary-extraction",
-                    "level": "error",
-                    "message": {
-                        "text": f"Canary token extracted in test {case.test_id}. "
-                        f"Found {case.canary_count} canary tokens in output."
-                    },
-                    "locations": [
-                        {
-                            "physicalLocation": {
-                                "artifactLocation": {
-                                    "uri": "data/attacks",
-                                    "uriBaseId": "%SRCROOT%",
-                                },
-                            },
-                            "message": {"text": f"Test case: {case.test_id}"},
-                        }
-                    ],
-                    "properties": {
-                        "test_id": case.test_id,
-                        "query": case.query,
-                    },
-                }
-            )
-
-    # Add aggregate findings from failures
-    for failure in report.failures:
-        rule_id = _threat_to_rule_id(failure.threat)
-        results.append(
-            {
-                "ruleId": rule_id,
-                "level": "error" if failure.threat == "canary" else "warning",
-                "message": {"text": failure.reason},
+            yield {
+                "ruleId": "canary-extraction",
+                "level": "error",
+                "message": {
+                    "text": f"Canary token extracted in test {case.test_id}. "
+                    f"Found {case.canary_count} canary tokens in output."
+                },
                 "locations": [
                     {
                         "physicalLocation": {
                             "artifactLocation": {
-                                "uri": report.corpus_path,
+                                "uri": "data/attacks",
                                 "uriBaseId": "%SRCROOT%",
                             },
                         },
-                        "message": {"text": f"Corpus: {report.corpus_path}"},
+                        "message": {"text": f"Test case: {case.test_id}"},
                     }
                 ],
                 "properties": {
-                    "value": failure.value,
-                    "threshold": failure.threshold,
+                    "test_id": case.test_id,
+                    "query": case.query,
                 },
             }
-        )
 
-    return results
+    # Add aggregate findings from failures
+    for failure in report.failures:
+        rule_id = _threat_to_rule_id(failure.threat)
+        yield {
+            "ruleId": rule_id,
+            "level": "error" if failure.threat == "canary" else "warning",
+            "message": {"text": failure.reason},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {
+                            "uri": report.corpus_path,
+                            "uriBaseId": "%SRCROOT%",
+                        },
+                    },
+                    "message": {"text": f"Corpus: {report.corpus_path}"},
+                }
+            ],
+            "properties": {
+                "value": failure.value,
+                "threshold": failure.threshold,
+            },
+        }
+
+
+# SARIF rule definitions; static, so built once at import
+_SARIF_RULES: list[dict] = [
+    {
+        "id": "canary-extraction",
+        "name": "CanaryExtraction",
+        "shortDescription": {"text": "Canary token extracted from RAG output"},
+        "fullDescription": {
+            "text": "A planted secret token was found in the RAG system output, "
+            "indicating direct memorization of private corpus content."
+        },
+        "defaultConfiguration": {"level": "error"},
+        "properties": {"security-severity": "9.0"},
+    },
+    {
+        "id": "verbatim-leakage",
+        "name": "VerbatimLeakage",
+        "shortDescription": {"text": "High verbatim text reproduction"},
+        "fullDescription": {
+            "text": "The RAG output contains significant verbatim reproduction of "
+            "private corpus content, indicating potential data leakage."
+        },
+        "defaultConfiguration": {"level": "warning"},
+        "properties": {"security-severity": "7.0"},
+    },
+    {
+        "id": "membership-inference",
+        "name": "MembershipInference",
+        "shortDescription": {"text": "Document membership can be inferred"},
+        "fullDescription": {
+            "text": "The RAG system behavior allows inference of whether "
+            "specific documents were in the training corpus."
+        },
+        "defaultConfiguration": {"level": "warning"},
+        "properties": {"security-severity": "5.0"},
+    },
+]
+
+
+_THREAT_RULE_IDS = {
+    "canary": "canary-extraction",
+    "verbatim": "verbatim-leakage",
+    "membership": "membership-inference",
+}
 
 
 def _threat_to_rule_id(threat: str) -> str:
     """Map threat name to SARIF rule ID."""
-    mapping = {
-        "canary": "canary-extraction",
-        "verbatim": "verbatim-leakage",
-        "membership": "membership-inference",
-    }
-    return mapping.get(threat, "unknown")
+    return _THREAT_RULE_IDS.get(threat, "unknown")
@@ -1,6 +1,6 @@
 """Schema for report output."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
@@ -34,7 +34,7 @@ class Report(BaseModel):
     """Main report schema."""
 
     schema_version: str = Field(default=SCHEMA_VERSION)
-    generated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    generated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
     # Summary metrics
     total_cases: int
@@ -1,6 +1,6 @@
 """Target adapters for testing different RAG backends."""
 
-from ragleaklab.targets.base import Target, TargetResponse
+from ragleaklab.targets.base import Target, TargetResponse, ask_batch
 from ragleaklab.targets.http import HttpTarget
 from ragleaklab.targets.inprocess import InProcessTarget
 
@@ -9,4 +9,5 @@ __all__ = [
     "InProcessTarget",
     "Target",
     "TargetResponse",
+    "ask_batch",
 ]
@@ -1,5 +1,6 @@
 """Base protocol for target adapters."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol
 
 from pydantic import BaseModel
@@ -33,3 +34,29 @@ class Target(Protocol):
             TargetResponse with answer and metadata.
         """
         ...
+
+
+def ask_batch(target: Target, queries: list[str], max_workers: int = 1) -> list[TargetResponse]:
+    """Send several queries to a target.
+
+    Uses the target's own ask_batch(queries) when it provides one (e.g. an
+    in-process pipeline that retrieves all queries in a single index pass)
+    and falls back to one ask() per query otherwise. With max_workers > 1
+    the fallback sends queries from a thread pool so that the latency of
+    remote targets overlaps.
+
+    Args:
+        target: Target to query.
+        queries: Query strings.
+        max_workers: Maximum number of in-flight ask() calls in the fallback.
+
+    Returns:
+        One TargetResponse per query, in order.
+    """
+    batch = getattr(target, "ask_batch", None)
+    if batch is not None:
+        return batch(queries)
+    if max_workers <= 1 or len(queries) <= 1:
+        return [target.ask(query) for query in queries]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+        return list(executor.map(target.ask, queries))
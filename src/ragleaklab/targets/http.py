@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import re
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ragleaklab.targets.base import TargetResponse
 
@@ -32,6 +33,7 @@ class HttpTarget:
         headers: dict | None = None,
         timeout: float = 30.0,
         request_json: dict[str, str] | None = None,
+        pool_size: int = 10,
     ) -> None:
         """Initialize HTTP target.
 
@@ -46,6 +48,8 @@ class HttpTarget:
             headers: Optional HTTP headers.
             timeout: Request timeout in seconds.
             request_json: Optional template dict with {{query}} placeholders.
+            pool_size: Maximum number of pooled keep-alive connections; set to
+                at least the number of concurrent requests.
         """
         self.url = url
         self.method = method.upper()
@@ -57,6 +61,16 @@ class HttpTarget:
         self.headers = headers or {"Content-Type": "application/json"}
         self.timeout = timeout
         self.request_json = request_json
+        self._template_dicts, self._template_slots = self._compile_template(request_json or {})
+
+        # One pooled session reuses connections across asks instead of a new
+        # TCP/TLS handshake per query; cookies are refused so that every ask
+        # stays independent, as with one-off requests.post calls
+        self._session = requests.Session()
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     @classmethod
     def from_config(cls, config: HttpTargetConfig) -> HttpTarget:
@@ -78,6 +92,7 @@ class HttpTarget:
             headers=config.headers if config.headers else None,
             timeout=config.timeout_sec,
             request_json=config.request_json,
+            pool_size=config.concurrency,
         )
 
     def _build_payload(self, query: str) -> dict:
@@ -86,21 +101,56 @@ class HttpTarget:
         If request_json is set, substitutes {{query}} placeholders.
         Otherwise uses simple {query_field: query} format.
         """
-        if self.request_json:
-            return self._substitute_template(self.request_json, query)
-        return {self.query_field: query}
-
-    def _substitute_template(self, template: dict, query: str) -> dict:
-        """Recursively substitute {{query}} in template dict."""
-        result = {}
-        for key, value in template.items():
-            if isinstance(value, str):
-                result[key] = re.sub(r"\{\{query\}\}", query, value)
-            elif isinstance(value, dict):
-                result[key] = self._substitute_template(value, query)
-            else:
-                result[key] = value
-        return result
+        if not self.request_json:
+            return {self.query_field: query}
+
+        # Copy only the dicts on the way to a placeholder; all other values
+        # are shared with the template, which is never mutated
+        payload = dict(self.request_json)
+        for path in self._template_dicts:
+            parent = payload
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = dict(parent[path[-1]])
+        for path, parts in self._template_slots:
+            parent = payload
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = query.join(parts)
+        return payload
+
+    @staticmethod
+    def _compile_template(template: dict) -> tuple[list[tuple], list[tuple]]:
+        """Locate {{query}} placeholders in a template dict once.
+
+        Returns:
+            Tuple of (dict_paths, slots). dict_paths lists the key paths of
+            nested dicts that contain a placeholder, parents first. slots
+            pairs the key path of each templated string with its text split
+            on {{query}}, so substitution is a single join.
+        """
+        dict_paths: list[tuple] = []
+        slots: list[tuple] = []
+
+        def walk(node: dict, prefix: tuple) -> bool:
+            found = False
+            for key, value in node.items():
+                path = (*prefix, key)
+                if isinstance(value, str):
+                    if "{{query}}" in value:
+                        slots.append((path, tuple(value.split("{{query}}"))))
+                        found = True
+                elif isinstance(value, dict):
+                    index = len(dict_paths)
+                    dict_paths.append(path)
+                    if walk(value, path):
+                        found = True
+                    else:
+                        del dict_paths[index:]
+            return found
+
+        walk(template, ())
+        return dict_paths, slots
 
     def ask(self, query: str) -> TargetResponse:
         """Query the HTTP RAG service.
@@ -117,14 +167,14 @@ class HttpTarget:
         payload = self._build_payload(query)
 
         if self.method == "POST":
-            response = requests.post(
+            response = self._session.post(
                 self.url,
                 json=payload,
                 headers=self.headers,
                 timeout=self.timeout,
             )
         else:  # GET
-            response = requests.get(
+            response = self._session.get(
                 self.url,
                 params=payload,
                 headers=self.headers,
@@ -27,12 +27,26 @@ class InProcessTarget:
         Returns:
             TargetResponse with answer and metadata.
         """
-        result = self.pipeline.query(query)
-
-        return TargetResponse(
-            answer=result.answer,
-            context=result.context,
-            retrieved_ids=result.retrieved_ids,
-            scores=result.scores,
-            metadata={},
-        )
+        return self.ask_batch([query])[0]
+
+    def ask_batch(self, queries: list[str]) -> list[TargetResponse]:
+        """Query the in-process RAG pipeline with several queries at once.
+
+        All queries are retrieved in one pass over the index.
+
+        Args:
+            queries: The query strings.
+
+        Returns:
+            One TargetResponse per query, in order.
+        """
+        return [
+            TargetResponse(
+                answer=result.answer,
+                context=result.context,
+                retrieved_ids=[chunk.full_id for chunk in result.retrieved_chunks],
+                scores=result.scores,
+                metadata={},
+            )
+            for result in self.pipeline.run_batch(queries)
+        ]
@@ -0,0 +1,41 @@
+"""Shared fixtures for tests."""
+
+from pathlib import Path
+
+import pytest
+
+from ragleaklab.attacks import TestCase, load_cases
+from ragleaklab.corpus import load_corpus
+from ragleaklab.corpus.loader import Document as CorpusDocument
+from ragleaklab.rag import Document, RAGPipeline
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture(scope="session")
+def public_corpus() -> list[CorpusDocument]:
+    """Documents of the public corpus, loaded once per session."""
+    return load_corpus(DATA_DIR / "corpus_public")
+
+
+@pytest.fixture(scope="session")
+def private_corpus() -> list[CorpusDocument]:
+    """Documents of the private canary corpus, loaded once per session."""
+    return load_corpus(DATA_DIR / "corpus_private_canary")
+
+
+@pytest.fixture(scope="session")
+def attack_cases() -> list[TestCase]:
+    """Test cases from data/attacks, parsed once per session."""
+    return load_cases(DATA_DIR / "attacks")
+
+
+@pytest.fixture(scope="session")
+def private_pipeline(private_corpus: list[CorpusDocument]) -> RAGPipeline:
+    """Pipeline indexed over the private canary corpus, built once per session.
+
+    Shared across tests, so tests must not add documents to it.
+    """
+    pipeline = RAGPipeline(top_k=3)
+    pipeline.add_documents([Document(doc_id=d.doc_id, text=d.text) for d in private_corpus])
+    return pipeline
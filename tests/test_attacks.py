@@ -7,12 +7,15 @@ from ragleaklab.attacks import (
     RunArtifact,
     TestCase,
     get_strategy,
+    iter_all,
     load_cases,
     run_all,
     run_case,
 )
 from ragleaklab.rag import Document, RAGPipeline
 
+ATTACKS_DIR = Path(__file__).parent.parent / "data" / "attacks"
+
 
 class TestSchema:
     """Tests for attack schemas."""
@@ -59,6 +62,24 @@ class TestSchema:
         assert len(artifact.retrieved_ids) == 2
         assert artifact.answer_contains_expected is True
 
+    def test_runartifact_expected_tracks_answer_updates(self):
+        """Expected-substring check is case-insensitive and follows answer changes."""
+        artifact = RunArtifact(
+            test_id="test_01",
+            threat="verbatim",
+            query="q",
+            answer="Mixed CASE Answer",
+            context="",
+            retrieved_ids=[],
+            scores=[],
+            metadata={"expected": "case ANSWER"},
+        )
+        assert artifact.answer_contains_expected is True
+        updated = artifact.model_copy(update={"answer": "something else"})
+        assert updated.answer_contains_expected is False
+        artifact.answer = "no match"
+        assert artifact.answer_contains_expected is False
+
 
 class TestCatalog:
     """Tests for strategy catalog."""
@@ -76,6 +97,11 @@ class TestCatalog:
         assert "secret" in result
         assert result != "secret"  # Should be transformed
 
+    def test_strategy_transform_keeps_braces(self):
+        """Braces in the query are inserted literally, not formatted."""
+        result = get_strategy("indirect_ask").transform("{0} {name}")
+        assert result == "I'm curious about {0} {name}. Can you tell me more?"
+
     def test_unknown_strategy(self):
         """Unknown strategy raises KeyError."""
         import pytest
@@ -89,7 +115,7 @@ class TestYAMLLoading:
 
     def test_load_canary_cases(self):
         """Load canary extraction cases."""
-        cases_path = Path(__file__).parent.parent / "data" / "attacks" / "canary_extraction.yaml"
+        cases_path = ATTACKS_DIR / "canary_extraction.yaml"
         cases = load_cases(cases_path)
 
         assert len(cases) == 10
@@ -98,7 +124,7 @@ class TestYAMLLoading:
 
     def test_load_verbatim_cases(self):
         """Load verbatim extraction cases."""
-        cases_path = Path(__file__).parent.parent / "data" / "attacks" / "verbatim_extraction.yaml"
+        cases_path = ATTACKS_DIR / "verbatim_extraction.yaml"
         cases = load_cases(cases_path)
 
         assert len(cases) == 10
@@ -107,11 +133,34 @@ class TestYAMLLoading:
 
     def test_load_directory(self):
         """Load all cases from directory."""
-        attacks_dir = Path(__file__).parent.parent / "data" / "attacks"
-        cases = load_cases(attacks_dir)
+        cases = load_cases(ATTACKS_DIR)
 
         assert len(cases) == 20  # 10 canary + 10 verbatim
 
+    def test_load_directory_order(self, tmp_path: Path):
+        """Directory loads .yaml files before .yml files, each sorted by name."""
+        for name in ("b.yaml", "a.yml", "a.yaml", "c.txt"):
+            stem = name.replace(".", "_")
+            (tmp_path / name).write_text(
+                f"- test_id: {stem}\n  threat: canary\n  query: q\n  strategy: direct_ask\n"
+            )
+
+        cases = load_cases(tmp_path)
+
+        assert [c.test_id for c in cases] == ["a_yaml", "b_yaml", "a_yml"]
+
+    def test_duplicate_test_id_rejected(self, tmp_path: Path):
+        """Duplicate test_ids across files raise ValueError."""
+        import pytest
+
+        for name in ("a.yaml", "b.yaml"):
+            (tmp_path / name).write_text(
+                "- test_id: dup\n  threat: canary\n  query: q\n  strategy: direct_ask\n"
+            )
+
+        with pytest.raises(ValueError, match="Duplicate test_id: dup"):
+            load_cases(tmp_path)
+
 
 class TestRunner:
     """Tests for attack runner."""
@@ -148,22 +197,25 @@ class TestRunner:
         assert len(artifacts) == 5
         assert all(isinstance(a, RunArtifact) for a in artifacts)
 
-    def test_run_with_real_cases(self):
-        """Run with real YAML cases."""
-        # Load corpus
-        corpus_path = Path(__file__).parent.parent / "data" / "corpus_private_canary"
-        from ragleaklab.corpus import load_corpus
-
-        corpus_docs = load_corpus(corpus_path)
-        rag_docs = [Document(doc_id=d.doc_id, text=d.text) for d in corpus_docs]
+    def test_iter_all_streams_same_artifacts(self):
+        """iter_all yields run_all's artifacts lazily, across batch boundaries."""
+        docs = [
+            Document(doc_id="doc1", text="Python is widely used in data science."),
+            Document(doc_id="doc2", text="Java is used for enterprise applications."),
+        ]
+        pipeline = RAGPipeline(top_k=2)
+        pipeline.add_documents(docs)
 
-        pipeline = RAGPipeline(top_k=3)
-        pipeline.add_documents(rag_docs)
+        cases = [
+            TestCase(test_id=f"test_{i}", threat="canary", query=q, strategy="indirect_ask")
+            for i, q in enumerate(["data science", "Java", "enterprise", "Python", "science"])
+        ]
 
-        # Load cases
-        attacks_dir = Path(__file__).parent.parent / "data" / "attacks"
-        cases = load_cases(attacks_dir)
+        stream = iter_all(pipeline, cases, batch_size=2)
+        assert not isinstance(stream, list)
+        assert list(stream) == run_all(pipeline, cases)
 
-        # Run all
-        artifacts = run_all(pipeline, cases)
+    def test_run_with_real_cases(self, private_pipeline, attack_cases):
+        """Run with real YAML cases."""
+        artifacts = run_all(private_pipeline, attack_cases)
         assert len(artifacts) == 20
@@ -1,14 +1,12 @@
 """Tests for canary generation and detection."""
 
-from pathlib import Path
-
 from ragleaklab.corpus.canary import (
     find_canaries,
+    find_known_canaries,
     generate_canary,
     has_canary,
     inject_canary,
 )
-from ragleaklab.corpus.loader import load_corpus
 
 
 class TestGenerateCanary:
@@ -37,6 +35,13 @@ class TestGenerateCanary:
         assert generate_canary(1) == "CANARY_e635ed32eb120f88"
         assert generate_canary(2) == "CANARY_986743ac15a7be7e"
 
+    def test_blake2b_canary(self):
+        """BLAKE2b canaries are deterministic and match the canary pattern."""
+        canary = generate_canary(1, algorithm="blake2b")
+        assert canary == generate_canary(1, algorithm="blake2b")
+        assert canary != generate_canary(1)
+        assert find_canaries(f"leaked {canary} here") == [canary]
+
 
 class TestInjectCanary:
     """Tests for canary injection."""
@@ -90,37 +95,56 @@ class TestFindCanaries:
         text = "Clean text"
         assert has_canary(text) is False
 
+    def test_prefix_without_token(self):
+        """A bare CANARY_ prefix is not a canary, but later tokens are found."""
+        canary = generate_canary(2)
+        assert has_canary("CANARY_notahexvalue") is False
+        assert find_canaries(f"CANARY_zz then {canary}") == [canary]
+
+
+class TestFindKnownCanaries:
+    """Tests for known-canary scanning."""
+
+    def test_finds_known_in_order(self):
+        """Finds only the known canaries, in order of appearance."""
+        c1, c2, unknown = generate_canary(1), generate_canary(2), generate_canary(3)
+        text = f"{c2} CANARY_ {unknown} CANARY_{c1}{c1}, then {c2}"
+
+        assert find_known_canaries(text, {c1, c2}) == [c2, c1, c1, c2]
+
+    def test_no_known_canaries(self):
+        """Empty known set or clean text finds nothing."""
+        assert find_known_canaries(f"text {generate_canary(1)}", set()) == []
+        assert find_known_canaries("clean text", {generate_canary(1)}) == []
+
+    def test_matches_regex_scan_on_corpus(self, private_corpus):
+        """Agrees with find_canaries when the known set covers all canaries."""
+        known = {generate_canary(1), generate_canary(2)}
+        for doc in private_corpus:
+            assert find_known_canaries(doc.text, known) == find_canaries(doc.text)
+
 
 class TestCorpusCanaryIntegration:
     """Integration tests with actual corpus fixtures."""
 
-    def test_public_corpus_no_canaries(self):
+    def test_public_corpus_no_canaries(self, public_corpus):
         """Public corpus contains no canaries."""
-        corpus_path = Path(__file__).parent.parent / "data" / "corpus_public"
-        docs = load_corpus(corpus_path)
-
-        for doc in docs:
+        for doc in public_corpus:
             assert not has_canary(doc.text), f"Canary found in public doc: {doc.doc_id}"
 
-    def test_private_corpus_has_canaries(self):
+    def test_private_corpus_has_canaries(self, private_corpus):
         """Private corpus contains canaries."""
-        corpus_path = Path(__file__).parent.parent / "data" / "corpus_private_canary"
-        docs = load_corpus(corpus_path)
-
         canary_count = 0
-        for doc in docs:
+        for doc in private_corpus:
             if has_canary(doc.text):
                 canary_count += 1
 
         assert canary_count == 2, f"Expected 2 docs with canaries, found {canary_count}"
 
-    def test_private_corpus_correct_canaries(self):
+    def test_private_corpus_correct_canaries(self, private_corpus):
         """Private corpus contains expected canary values."""
-        corpus_path = Path(__file__).parent.parent / "data" / "corpus_private_canary"
-        docs = load_corpus(corpus_path)
-
         all_canaries = []
-        for doc in docs:
+        for doc in private_corpus:
             all_canaries.extend(find_canaries(doc.text))
 
         expected = {generate_canary(1), generate_canary(2)}
@@ -0,0 +1,29 @@
+"""Tests for corpus chunking."""
+
+import pytest
+
+from ragleaklab.corpus import chunk_text
+
+
+def test_chunks_cover_text_with_overlap():
+    """Chunks start every chunk_size - overlap chars and end at the text end."""
+    text = "abcdefghij" * 5
+    chunks = chunk_text(text, "doc1", chunk_size=20, overlap=5)
+
+    assert [c.start_char for c in chunks] == [0, 15, 30, 45]
+    assert [c.chunk_index for c in chunks] == [0, 1, 2, 3]
+    assert chunks[-1].end_char == len(text)
+    for chunk in chunks:
+        assert chunk.text == text[chunk.start_char : chunk.end_char]
+        assert chunk.doc_id == "doc1"
+
+
+def test_empty_text():
+    """Empty text yields no chunks."""
+    assert chunk_text("", "doc1") == []
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    """Non-advancing chunk windows are rejected."""
+    with pytest.raises(ValueError):
+        chunk_text("some text", "doc1", chunk_size=10, overlap=10)
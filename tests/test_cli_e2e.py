@@ -1,43 +1,43 @@
 """End-to-end tests for CLI."""
 
 import json
-import subprocess
-import sys
 from pathlib import Path
 
+from typer.testing import CliRunner
+
+from ragleaklab.__main__ import app
+
+# In-process invocation; tests/test_smoke.py keeps a real subprocess check (-m slow)
+runner = CliRunner()
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+PRIVATE_CORPUS = DATA_DIR / "corpus_private_canary"
+ATTACKS_DIR = DATA_DIR / "attacks"
+
 
 class TestCLIRun:
     """E2E tests for CLI run command."""
 
     def test_cli_run_produces_outputs(self, tmp_path: Path):
         """CLI run creates report.json and runs.jsonl."""
-        # Setup paths
-        project_root = Path(__file__).parent.parent
-        corpus = project_root / "data" / "corpus_private_canary"
-        attacks = project_root / "data" / "attacks"
         out_dir = tmp_path / "output"
 
         # Run CLI
-        result = subprocess.run(
+        result = runner.invoke(
+            app,
             [
-                sys.executable,
-                "-m",
-                "ragleaklab",
                 "run",
                 "--corpus",
-                str(corpus),
+                str(PRIVATE_CORPUS),
                 "--attacks",
-                str(attacks),
+                str(ATTACKS_DIR),
                 "--out",
                 str(out_dir),
             ],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
         )
 
         # Check exit code
-        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        assert result.exit_code == 0, f"CLI failed: {result.output}"
 
         # Check report.json exists and is valid
         report_path = out_dir / "report.json"
@@ -77,27 +77,19 @@ class TestCLIRun:
 
     def test_cli_run_detects_canaries(self, tmp_path: Path):
         """CLI run correctly detects canary leaks."""
-        project_root = Path(__file__).parent.parent
-        corpus = project_root / "data" / "corpus_private_canary"
-        attacks = project_root / "data" / "attacks"
         out_dir = tmp_path / "output"
 
-        subprocess.run(
+        runner.invoke(
+            app,
             [
-                sys.executable,
-                "-m",
-                "ragleaklab",
                 "run",
                 "--corpus",
-                str(corpus),
+                str(PRIVATE_CORPUS),
                 "--attacks",
-                str(attacks),
+                str(ATTACKS_DIR),
                 "--out",
                 str(out_dir),
             ],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
         )
 
         with open(out_dir / "report.json") as f:
@@ -108,28 +100,39 @@ class TestCLIRun:
         assert isinstance(report["canary_extracted"], bool)
         assert isinstance(report["canary_count"], int)
 
+    def test_cli_run_rejects_repeated_pack(self, tmp_path: Path):
+        """Test ids duplicated across merged packs fail instead of running twice."""
+        out_dir = tmp_path / "output"
+
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                "--corpus",
+                str(PRIVATE_CORPUS),
+                "--pack",
+                "canary-basic",
+                "--pack",
+                "canary-basic",
+                "--out",
+                str(out_dir),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Duplicate test_id" in result.output
+        assert not (out_dir / "runs.jsonl").exists()
+
     def test_cli_version(self):
         """CLI version command works."""
-        project_root = Path(__file__).parent.parent
-        result = subprocess.run(
-            [sys.executable, "-m", "ragleaklab", "version"],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-        )
+        result = runner.invoke(app, ["version"])
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert "RAGLeakLab" in result.stdout
 
     def test_cli_help(self):
         """CLI help works."""
-        project_root = Path(__file__).parent.parent
-        result = subprocess.run(
-            [sys.executable, "-m", "ragleaklab", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-        )
+        result = runner.invoke(app, ["--help"])
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert "run" in result.stdout
@@ -63,6 +63,7 @@ class TestConfigLoading:
         assert cfg.target.url == "http://localhost:8000/ask"
         assert cfg.target.request_json == {"question": "{{query}}"}
         assert cfg.target.response == {"answer_field": "response"}
+        assert cfg.target.concurrency == 8
 
     def test_env_var_substitution(self, tmp_path: Path, monkeypatch):
         """Substitutes environment variables in config."""
@@ -87,6 +88,27 @@ class TestConfigLoading:
         assert isinstance(cfg.target, HttpTargetConfig)
         assert cfg.target.headers["Authorization"] == "Bearer secret123"
 
+    def test_env_var_substitution_edge_cases(self, tmp_path: Path, monkeypatch):
+        """Unset ${VAR} expands to empty; bare $VAR is left untouched."""
+        monkeypatch.delenv("MISSING_TOKEN", raising=False)
+        monkeypatch.setenv("MY_TOKEN", "secret123")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            dedent("""
+            target:
+              type: http
+              url: http://localhost:8000/ask
+              headers:
+                X-Missing: "a${MISSING_TOKEN}b"
+                X-Bare: "$MY_TOKEN"
+            """)
+        )
+
+        cfg = load_config(config_file)
+
+        assert isinstance(cfg.target, HttpTargetConfig)
+        assert cfg.target.headers == {"X-Missing": "ab", "X-Bare": "$MY_TOKEN"}
+
     def test_thresholds_config(self, tmp_path: Path):
         """Loads custom thresholds."""
         config_file = tmp_path / "config.yaml"
@@ -139,6 +161,29 @@ class TestHttpTargetFromConfig:
         body = json.loads(responses.calls[0].request.body)
         assert body == {"question": "What is the meaning of life?"}
 
+    @responses.activate
+    def test_template_keeps_backslashes_in_query(self):
+        """Queries with backslashes are substituted verbatim."""
+        responses.add(
+            responses.POST,
+            "http://localhost:8000/ask",
+            json={"response": "ok"},
+            status=200,
+        )
+
+        cfg = HttpTargetConfig(
+            type="http",
+            url="http://localhost:8000/ask",
+            request_json={"text": "Q: {{query}} ({{query}})"},
+        )
+
+        HttpTarget.from_config(cfg).ask(r"C:\temp\d \1")
+
+        import json
+
+        body = json.loads(responses.calls[0].request.body)
+        assert body == {"text": r"Q: C:\temp\d \1 (C:\temp\d \1)"}
+
     @responses.activate
     def test_runner_with_http_config(self, tmp_path: Path):
         """run_all_with_target works with HttpTarget from config."""
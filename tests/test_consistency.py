@@ -7,6 +7,7 @@ from ragleaklab.metrics.consistency import (
     _calculate_answer_similarity,
     _calculate_retrieval_consistency,
     _find_dominant_doc_id,
+    _summarize_doc_ids,
     membership_consistency,
 )
 from ragleaklab.metrics.paraphrase import (
@@ -35,6 +36,13 @@ class TestParaphrases:
         p2 = generate_paraphrases("database config", count=5)
         assert p1 == p2
 
+    def test_cached_results_are_independent(self):
+        """Mutating a returned list does not affect later calls."""
+        p1 = generate_paraphrases("cache topic", count=3)
+        p1.append("extra")
+        p2 = generate_paraphrases(" cache topic ", count=3)
+        assert p2 == ["cache topic", "What is cache topic?", "Tell me about cache topic"]
+
     def test_max_count_capped(self):
         """Count is capped at available templates."""
         paraphrases = generate_paraphrases("topic", count=100)
@@ -109,12 +117,31 @@ class TestDominantDocId:
         doc_ids = [["doc1", "doc2"], ["doc1", "doc3"], ["doc2", "doc1"]]
         assert _find_dominant_doc_id(doc_ids) == "doc1"
 
+    def test_tie_prefers_first_seen(self):
+        """Ties resolve to the doc_id retrieved first."""
+        doc_ids = [["doc2", "doc1"], ["doc1", "doc2"]]
+        assert _find_dominant_doc_id(doc_ids) == "doc2"
+
     def test_empty_returns_none(self):
         """Empty input returns None."""
         assert _find_dominant_doc_id([]) is None
         assert _find_dominant_doc_id([[]]) is None
 
 
+class TestSummarizeDocIds:
+    """Tests for the fused doc_id summary."""
+
+    def test_consistency_and_dominant_together(self):
+        """Returns top-1 consistency and the overall dominant doc_id."""
+        doc_ids = [["doc3", "doc1"], ["doc1"], ["doc3", "doc1"]]
+        assert _summarize_doc_ids(doc_ids) == (2 / 3, "doc1")
+
+    def test_empty_lists(self):
+        """Empty input yields zero consistency and no dominant doc_id."""
+        assert _summarize_doc_ids([]) == (0.0, None)
+        assert _summarize_doc_ids([[], []]) == (0.0, None)
+
+
 class MockTarget:
     """Mock target for testing consistency."""
 
@@ -167,3 +194,57 @@ class TestMembershipConsistency:
         result = membership_consistency(target, "test query", paraphrase_count=3)
 
         assert result.dominant_doc_id == "important_doc"
+
+    def test_in_process_target_batches_paraphrases(self):
+        """In-process targets answer all paraphrases via one batched call."""
+        from ragleaklab.rag import Document, RAGPipeline
+        from ragleaklab.targets import InProcessTarget
+
+        pipeline = RAGPipeline(top_k=2)
+        pipeline.add_documents(
+            [
+                Document(doc_id="db", text="The database config uses port 5432 and TLS."),
+                Document(doc_id="web", text="The web server listens on port 443."),
+            ]
+        )
+        target = InProcessTarget(pipeline)
+
+        result = membership_consistency(target, "database config", paraphrase_count=3)
+
+        assert result.paraphrases_tested == 3
+        assert result.dominant_doc_id == "db:c0"
+        assert target.ask("database config") == target.ask_batch(["database config"])[0]
+
+    def test_concurrent_paraphrases_match_sequential(self):
+        """Concurrent fallback asks give the same result as sequential ones."""
+        sequential = membership_consistency(
+            MockTarget("doc1", "The answer"), "database config", paraphrase_count=5
+        )
+        target = MockTarget("doc1", "The answer")
+        concurrent = membership_consistency(
+            target, "database config", paraphrase_count=5, max_workers=4
+        )
+
+        assert concurrent == sequential
+        assert target.call_count == 5
+
+    def test_skip_trivial_bypasses_target(self):
+        """Trivial probes score zero without querying the target when skipping."""
+        target = MockTarget("doc1", "The answer")
+
+        single_word = membership_consistency(target, "password", skip_trivial=True)
+        one_paraphrase = membership_consistency(
+            target, "database config", paraphrase_count=1, skip_trivial=True
+        )
+
+        assert target.call_count == 0
+        for result in (single_word, one_paraphrase):
+            assert result.score == 0.0
+            assert result.dominant_doc_id is None
+            assert result.paraphrases_tested == 0
+
+        # Non-trivial probes are unaffected
+        result = membership_consistency(
+            target, "database config", paraphrase_count=3, skip_trivial=True
+        )
+        assert result.paraphrases_tested == 3
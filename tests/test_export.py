@@ -4,9 +4,14 @@ import json
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
-from ragleaklab.reporting import export_junit, export_sarif
+import pytest
+
+from ragleaklab.reporting import JsonlWriter, export_json, export_jsonl, export_junit, export_sarif
 from ragleaklab.reporting.schema import CaseResult, FailureReason, Report
 
+# Expected SARIF bytes, written by the exporter before its serializer changed
+GOLDEN_DIR = Path(__file__).parent / "data" / "sarif"
+
 
 def _create_test_report() -> tuple[Report, list[CaseResult]]:
     """Create test report and case results."""
@@ -63,93 +68,190 @@ def _create_test_report() -> tuple[Report, list[CaseResult]]:
     return report, case_results
 
 
+def _create_non_ascii_report() -> tuple[Report, list[CaseResult]]:
+    """Create a failing report whose user-controlled strings are not ASCII."""
+    report, case_results = _create_test_report()
+    report = report.model_copy(
+        update={
+            "failures": [
+                FailureReason(threat="canary", reason="Canary ✓ found", value=1.0, threshold=0.0),
+                FailureReason(
+                    threat="verbatim", reason="Überlappung 35% 🔥", value=0.35, threshold=0.1
+                ),
+            ]
+        }
+    )
+    case_results = [
+        case_results[0].model_copy(update={"test_id": "tëst_01", "query": 'q <&> "é"'}),
+        case_results[1],
+    ]
+    return report, case_results
+
+
+def _create_passing_report() -> tuple[Report, list[CaseResult]]:
+    """Create a passing report with nothing to flag."""
+    report, _ = _create_test_report()
+    return report.model_copy(update={"failures": [], "overall_pass": True}), []
+
+
+def _create_aggregate_only_report() -> tuple[Report, list[CaseResult]]:
+    """Create a failing report where no individual case leaked a canary."""
+    report, case_results = _create_test_report()
+    return report, [case_results[1]]
+
+
+@pytest.fixture(scope="module")
+def sample_report() -> tuple[Report, list[CaseResult]]:
+    """Report and case results shared by read-only tests in this module."""
+    return _create_test_report()
+
+
+@pytest.fixture(scope="module")
+def junit_tree(tmp_path_factory: pytest.TempPathFactory, sample_report) -> ET.ElementTree:
+    """JUnit export of sample_report, written and parsed once per module."""
+    output_path = tmp_path_factory.mktemp("junit") / "junit.xml"
+    export_junit(*sample_report, output_path)
+    return ET.parse(output_path)
+
+
+@pytest.fixture(scope="module")
+def sarif_doc(tmp_path_factory: pytest.TempPathFactory, sample_report) -> dict:
+    """SARIF export of sample_report, written and loaded once per module."""
+    output_path = tmp_path_factory.mktemp("sarif") / "results.sarif"
+    export_sarif(*sample_report, output_path)
+    return json.loads(output_path.read_text())
+
+
+class TestJsonExport:
+    """Tests for report JSON export."""
+
+    def test_round_trips_report(self, tmp_path: Path):
+        """Writes a report that loads back to an equal Report."""
+        report, _ = _create_test_report()
+        output_path = tmp_path / "report.json"
+
+        export_json(report, output_path)
+
+        assert output_path.read_text() == report.model_dump_json(indent=2)
+        assert Report(**json.loads(output_path.read_text())) == report
+
+    def test_generated_at_is_utc(self):
+        """Report timestamps carry an explicit UTC offset."""
+        from datetime import datetime, timedelta
+
+        report, _ = _create_test_report()
+
+        assert datetime.fromisoformat(report.generated_at).utcoffset() == timedelta(0)
+
+    def test_compact(self, tmp_path: Path):
+        """indent=None writes compact JSON."""
+        report, _ = _create_test_report()
+        output_path = tmp_path / "report.json"
+
+        export_json(report, output_path, indent=None)
+
+        assert output_path.read_text() == report.model_dump_json()
+
+
+class TestJsonlExport:
+    """Tests for JSON Lines export."""
+
+    def test_one_line_per_case(self, tmp_path: Path):
+        """Writes one JSON object per case, round-trippable to CaseResult."""
+        _, case_results = _create_test_report()
+        output_path = tmp_path / "runs.jsonl"
+
+        export_jsonl(case_results, output_path)
+
+        lines = output_path.read_text().splitlines()
+        assert len(lines) == len(case_results)
+        for line, case in zip(lines, case_results, strict=True):
+            assert CaseResult(**json.loads(line)) == case
+            assert line == case.model_dump_json()
+
+    def test_incremental_writer_matches_export(self, tmp_path: Path):
+        """JsonlWriter produces the same file as export_jsonl."""
+        _, case_results = _create_test_report()
+        export_jsonl(case_results, tmp_path / "batch.jsonl")
+
+        with JsonlWriter(tmp_path / "stream.jsonl") as writer:
+            for case in case_results:
+                writer.write(case)
+
+        assert (tmp_path / "stream.jsonl").read_bytes() == (tmp_path / "batch.jsonl").read_bytes()
+
+
 class TestJunitExport:
     """Tests for JUnit export."""
 
-    def test_creates_valid_xml(self, tmp_path: Path):
+    def test_creates_valid_xml(self, junit_tree: ET.ElementTree):
         """Creates valid JUnit XML."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "junit.xml"
-
-        export_junit(report, case_results, output_path)
-
-        # Parse XML to verify validity
-        tree = ET.parse(output_path)
-        root = tree.getroot()
+        root = junit_tree.getroot()
         assert root.tag == "testsuite"
         assert root.get("name") == "RAGLeakLab Security Audit"
 
-    def test_includes_failures(self, tmp_path: Path):
+    def test_includes_failures(self, junit_tree: ET.ElementTree):
         """Includes failure elements for failed tests."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "junit.xml"
-
-        export_junit(report, case_results, output_path)
-
-        tree = ET.parse(output_path)
-        failures = tree.findall(".//failure")
+        failures = junit_tree.findall(".//failure")
         assert len(failures) > 0
 
-    def test_aggregate_failures(self, tmp_path: Path):
+    def test_aggregate_failures(self, junit_tree: ET.ElementTree):
         """Includes aggregate failures from report."""
-        report, case_results = _create_test_report()
+        testcases = junit_tree.findall(".//testcase[@classname='ragleaklab.aggregate']")
+        assert len(testcases) == 2  # canary + verbatim
+
+    def test_empty_suite(self, tmp_path: Path):
+        """Writes a valid, empty testsuite when there is nothing to report."""
+        report, _ = _create_test_report()
+        report = report.model_copy(update={"failures": []})
         output_path = tmp_path / "junit.xml"
 
-        export_junit(report, case_results, output_path)
+        export_junit(report, [], output_path)
 
-        tree = ET.parse(output_path)
-        testcases = tree.findall(".//testcase[@classname='ragleaklab.aggregate']")
-        assert len(testcases) == 2  # canary + verbatim
+        root = ET.parse(output_path).getroot()
+        assert root.get("tests") == "0"
+        assert root.get("failures") == "0"
+        assert list(root) == []
 
 
 class TestSarifExport:
     """Tests for SARIF export."""
 
-    def test_creates_valid_sarif(self, tmp_path: Path):
+    def test_creates_valid_sarif(self, sarif_doc: dict):
         """Creates valid SARIF JSON."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "results.sarif"
+        assert sarif_doc["version"] == "2.1.0"
+        assert "$schema" in sarif_doc
 
-        export_sarif(report, case_results, output_path)
-
-        sarif = json.loads(output_path.read_text())
-        assert sarif["version"] == "2.1.0"
-        assert "$schema" in sarif
-
-    def test_includes_rules(self, tmp_path: Path):
+    def test_includes_rules(self, sarif_doc: dict):
         """SARIF includes rule definitions."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "results.sarif"
-
-        export_sarif(report, case_results, output_path)
-
-        sarif = json.loads(output_path.read_text())
-        rules = sarif["runs"][0]["tool"]["driver"]["rules"]
+        rules = sarif_doc["runs"][0]["tool"]["driver"]["rules"]
         rule_ids = [r["id"] for r in rules]
         assert "canary-extraction" in rule_ids
         assert "verbatim-leakage" in rule_ids
 
-    def test_includes_results(self, tmp_path: Path):
+    def test_includes_results(self, sarif_doc: dict):
         """SARIF includes findings as results."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "results.sarif"
-
-        export_sarif(report, case_results, output_path)
-
-        sarif = json.loads(output_path.read_text())
-        results = sarif["runs"][0]["results"]
+        results = sarif_doc["runs"][0]["results"]
         assert len(results) > 0
 
-    def test_canary_detection_result(self, tmp_path: Path):
+    def test_canary_detection_result(self, sarif_doc: dict):
         """SARIF includes canary detection as error."""
-        report, case_results = _create_test_report()
-        output_path = tmp_path / "results.sarif"
-
-        export_sarif(report, case_results, output_path)
-
-        sarif = json.loads(output_path.read_text())
-        results = sarif["runs"][0]["results"]
+        results = sarif_doc["runs"][0]["results"]
         canary_results = [r for r in results if r["ruleId"] == "canary-extraction"]
         # 1 per-case finding + 1 aggregate failure
         assert len(canary_results) == 2
         assert canary_results[0]["level"] == "error"
+
+    @pytest.mark.parametrize("name", ["non_ascii", "no_results", "aggregate_only"])
+    def test_matches_golden_file(self, tmp_path: Path, name: str):
+        """Streamed SARIF bytes match output written before streaming."""
+        report, case_results = {
+            "non_ascii": _create_non_ascii_report,
+            "no_results": _create_passing_report,
+            "aggregate_only": _create_aggregate_only_report,
+        }[name]()
+        output_path = tmp_path / "results.sarif"
+
+        export_sarif(report, case_results, output_path)
+
+        assert output_path.read_bytes() == (GOLDEN_DIR / f"{name}.sarif").read_bytes()
@@ -1,5 +1,9 @@
 """Tests for HTTP target adapter."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import responses
 
 from ragleaklab.attacks import TestCase, run_all_with_target, run_case_with_target
@@ -105,6 +109,50 @@ class TestHttpTarget:
         assert len(artifacts) == 3
         assert artifacts[0].answer == "Answer 0"
 
+    @responses.activate
+    def test_run_all_with_http_target_concurrent(self):
+        """Concurrent run_all_with_target keeps results in case order."""
+        responses.add_callback(
+            responses.POST,
+            "http://localhost:8000/ask",
+            callback=lambda request: (200, {}, json.dumps({"answer": request.body.decode()})),
+        )
+
+        target = HttpTarget(url="http://localhost:8000/ask")
+        cases = [
+            TestCase(test_id=f"test_{i}", threat="canary", query=f"q{i}", strategy="direct_ask")
+            for i in range(10)
+        ]
+
+        artifacts = run_all_with_target(target, cases, max_workers=4)
+
+        assert [a.test_id for a in artifacts] == [c.test_id for c in cases]
+        for case, artifact in zip(cases, artifacts, strict=True):
+            assert json.loads(artifact.answer) == {"query": case.query}
+
+    @responses.activate
+    def test_run_all_with_http_target_overlaps_requests(self):
+        """All requests are in flight at once when max_workers covers the cases."""
+        # Each response waits until all ten requests have arrived; a serial
+        # runner would break the barrier on timeout
+        barrier = threading.Barrier(10, timeout=5)
+
+        def callback(request):
+            barrier.wait()
+            return 200, {}, json.dumps({"answer": "ok"})
+
+        responses.add_callback(responses.POST, "http://localhost:8000/ask", callback=callback)
+
+        target = HttpTarget(url="http://localhost:8000/ask")
+        cases = [
+            TestCase(test_id=f"test_{i}", threat="canary", query=f"q{i}", strategy="direct_ask")
+            for i in range(10)
+        ]
+
+        artifacts = run_all_with_target(target, cases, max_workers=10)
+
+        assert [a.answer for a in artifacts] == ["ok"] * 10
+
     @responses.activate
     def test_metrics_work_with_http_target(self):
         """Metrics can be applied to HttpTarget results."""
@@ -149,3 +197,86 @@ class TestHttpTarget:
         response = target.ask("search query")
 
         assert response.answer == "GET response"
+
+    @responses.activate
+    def test_session_does_not_carry_cookies(self):
+        """Cookies set by the target are not sent back on later asks."""
+        responses.add(
+            responses.POST,
+            "http://localhost:8000/ask",
+            json={"answer": "first"},
+            headers={"Set-Cookie": "session=abc"},
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            "http://localhost:8000/ask",
+            json={"answer": "second"},
+            status=200,
+        )
+
+        target = HttpTarget(url="http://localhost:8000/ask")
+        target.ask("one")
+        target.ask("two")
+
+        assert len(responses.calls) == 2
+        assert "Cookie" not in responses.calls[1].request.headers
+
+    def test_nested_template_payload(self):
+        """Nested request_json templates are filled without touching the template."""
+        template = {
+            "input": {"text": "Q: {{query}} ({{query}})", "lang": "en"},
+            "options": {"top_k": 3},
+            "mode": "chat",
+        }
+        target = HttpTarget(url="http://localhost:8000/ask", request_json=template)
+
+        first = target._build_payload("alpha")
+        second = target._build_payload("beta")
+
+        assert first == {
+            "input": {"text": "Q: alpha (alpha)", "lang": "en"},
+            "options": {"top_k": 3},
+            "mode": "chat",
+        }
+        assert second["input"]["text"] == "Q: beta (beta)"
+        assert template["input"]["text"] == "Q: {{query}} ({{query}})"
+
+    def test_asks_reuse_one_connection(self):
+        """Repeated asks to the same host share one keep-alive connection."""
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                connections.append(self.client_address)
+                super().setup()
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps({"answer": "ok"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        try:
+            target = HttpTarget(url=f"http://127.0.0.1:{server.server_port}/ask")
+            case = TestCase(test_id="t1", threat="canary", query="q", strategy="direct_ask")
+            for _ in range(20):
+                assert run_case_with_target(target, case).answer == "ok"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(connections) == 1
@@ -1,14 +1,18 @@
 """Tests for corpus loader."""
 
+import os
 from pathlib import Path
 
 from ragleaklab.corpus.loader import load_corpus
 
+DATA_DIR = Path(__file__).parent.parent / "data"
+PUBLIC_CORPUS = DATA_DIR / "corpus_public"
+PRIVATE_CORPUS = DATA_DIR / "corpus_private_canary"
+
 
 def test_load_corpus_public():
     """Test loading public corpus documents."""
-    corpus_path = Path(__file__).parent.parent / "data" / "corpus_public"
-    docs = load_corpus(corpus_path)
+    docs = load_corpus(PUBLIC_CORPUS)
 
     assert len(docs) == 2
     doc_ids = {doc.doc_id for doc in docs}
@@ -18,8 +22,7 @@ def test_load_corpus_public():
 
 def test_load_corpus_private():
     """Test loading private corpus with canaries."""
-    corpus_path = Path(__file__).parent.parent / "data" / "corpus_private_canary"
-    docs = load_corpus(corpus_path)
+    docs = load_corpus(PRIVATE_CORPUS)
 
     assert len(docs) == 2
     doc_ids = {doc.doc_id for doc in docs}
@@ -33,11 +36,29 @@ def test_load_corpus_nonexistent():
     assert docs == []
 
 
-def test_document_has_text():
+def test_document_has_text(public_corpus):
     """Test that loaded documents have non-empty text."""
-    corpus_path = Path(__file__).parent.parent / "data" / "corpus_public"
-    docs = load_corpus(corpus_path)
-
-    for doc in docs:
+    for doc in public_corpus:
         assert doc.text
         assert len(doc.text) > 0
+
+
+def test_load_corpus_sequential_matches_parallel():
+    """Sequential and threaded loading return the same documents in order."""
+    assert load_corpus(PRIVATE_CORPUS, parallel=False) == load_corpus(PRIVATE_CORPUS)
+
+
+def test_load_corpus_sees_modified_files(tmp_path: Path):
+    """Test that rewritten files are re-read, even with unchanged mtime and size."""
+    doc_path = tmp_path / "doc.txt"
+    doc_path.write_text("first", encoding="utf-8")
+    os.utime(doc_path, ns=(1_000_000_000, 1_000_000_000))
+    assert load_corpus(tmp_path)[0].text == "first"
+
+    # Same size and mtime, as after a rewrite within one coarse mtime tick
+    doc_path.write_text("again", encoding="utf-8")
+    os.utime(doc_path, ns=(1_000_000_000, 1_000_000_000))
+    assert load_corpus(tmp_path)[0].text == "again"
+
+    (tmp_path / "extra.txt").write_text("more", encoding="utf-8")
+    assert [d.doc_id for d in load_corpus(tmp_path)] == ["doc", "extra"]
@@ -3,10 +3,16 @@
 from ragleaklab.attacks.schema import RunArtifact
 from ragleaklab.metrics import (
     CanaryResult,
+    MembershipAccumulator,
+    VerbatimIndex,
     VerbatimResult,
     apply_thresholds,
+    canary_present,
     detect_canary,
+    detect_canary_batch,
+    iter_scores,
     membership_confidence,
+    score_answers,
     verbatim_overlap,
 )
 from ragleaklab.metrics.verdict import ThresholdConfig
@@ -41,6 +47,32 @@ class TestCanaryMetric:
         assert result.count == 2
         assert len(result.matches) == 2
 
+    def test_canary_present_agrees_with_detect(self):
+        """canary_present matches detect_canary().present."""
+        answers = [
+            "Leaked CANARY_e635ed32eb120f88 here",
+            "CANARY_ prefix but no token",
+            "CANARY_nothex00000000 then CANARY_986743ac15a7be7e",
+            "",
+        ]
+        for answer in answers:
+            assert canary_present(answer) == detect_canary(answer).present
+
+    def test_detect_canary_batch_matches_single(self):
+        """Batch detection agrees with per-answer detection."""
+        canary1 = "CANARY_e635ed32eb120f88"
+        canary2 = "CANARY_986743ac15a7be7e"
+        answers = [
+            f"First {canary1} and {canary2}",
+            "",
+            "No secrets here",
+            f"{canary2}",
+            f"Trailing {canary1}",
+        ]
+
+        assert detect_canary_batch(answers) == [detect_canary(a) for a in answers]
+        assert detect_canary_batch([]) == []
+
     def test_canary_result_structure(self):
         """CanaryResult has expected structure."""
         result = CanaryResult(present=True, count=1, matches=["CANARY_test"])
@@ -109,6 +141,132 @@ class TestVerbatimMetric:
         result = verbatim_overlap(answer, sources, min_chars=50)
         assert result.score == 0.0
 
+    def test_index_matches_plain_sources(self):
+        """Prebuilt VerbatimIndex gives the same result as raw sources."""
+        answer = "This is the exact text from the document, and some more words."
+        sources = [
+            ("doc1", "Some other content here, and some more words."),
+            ("doc2", "This is the exact text from the document."),
+        ]
+        index = VerbatimIndex(sources)
+
+        assert verbatim_overlap(answer, index, min_chars=10) == verbatim_overlap(
+            answer, sources, min_chars=10
+        )
+
+    def test_lcs_length_matches_naive(self):
+        """Binary-search LCS length agrees with a brute-force search."""
+        from ragleaklab.metrics.verbatim import _longest_common_substring_length
+
+        def naive(s1: str, s2: str) -> int:
+            return max(
+                (j - i for i in range(len(s1)) for j in range(i + 1, len(s1) + 1) if s1[i:j] in s2),
+                default=0,
+            )
+
+        pairs = [
+            ("abcabcbb", "bcbbabca"),
+            ("the quick brown fox", "a quick brown dog"),
+            ("aaaa", "aa"),
+            ("", "abc"),
+            ("xyz", "abc"),
+        ]
+        for s1, s2 in pairs:
+            assert _longest_common_substring_length(s1, s2) == naive(s1, s2)
+        # Lengths below min_length are reported as 0
+        assert _longest_common_substring_length("quick brown", "quick red", min_length=7) == 0
+
+    def test_index_from_documents(self):
+        """Index built from documents matches one built from tuples."""
+        from ragleaklab.corpus.loader import Document
+
+        docs = [
+            Document(doc_id="doc1", text="Some unrelated content here.", source_path="a"),
+            Document(doc_id="doc2", text="This is the exact text from the doc.", source_path="b"),
+        ]
+        answer = "This is the exact text from the doc."
+
+        from_docs = VerbatimIndex.from_documents(docs)
+        from_pairs = VerbatimIndex([(d.doc_id, d.text) for d in docs])
+
+        assert len(from_docs) == 2
+        assert verbatim_overlap(answer, from_docs) == verbatim_overlap(answer, from_pairs)
+
+    def test_shingle_prefilter_keeps_results(self):
+        """Prefiltered and unfiltered scoring agree on sources that match."""
+        answer = "Backups are encrypted with AES-256 and stored offsite weekly."
+        sources = [
+            ("doc1", "Unrelated text about gardening and tomatoes."),
+            ("doc2", "All backups are encrypted with AES-256 and stored offsite weekly."),
+        ]
+
+        filtered = verbatim_overlap(answer, VerbatimIndex(sources, shingle_len=8), min_chars=20)
+        # Shingles longer than min_chars disable the prefilter
+        unfiltered = verbatim_overlap(answer, VerbatimIndex(sources, shingle_len=64), min_chars=20)
+
+        assert filtered == unfiltered
+        assert filtered.source_with_max_overlap == "doc2"
+
+    def test_candidate_sources_share_a_shingle(self):
+        """Only sources sharing a character shingle are LCS candidates."""
+        index = VerbatimIndex(
+            [
+                ("doc1", "Completely unrelated words."),
+                ("doc2", "Backups are encrypted nightly."),
+                ("doc3", "Keys are ENCRYPTED at rest."),
+            ],
+            shingle_len=8,
+        )
+
+        assert index.candidate_sources("data is encrypted here") == [1, 2]
+        assert index.candidate_sources("nothing") == []
+
+    def test_index_ngram_size_mismatch(self):
+        """VerbatimIndex rejects a different n-gram size."""
+        import pytest
+
+        index = VerbatimIndex([("doc1", "Some content")], min_ngram_len=4)
+        with pytest.raises(ValueError, match="min_ngram_len"):
+            verbatim_overlap("Some answer", index, min_ngram_len=3)
+
+
+class TestScoreAnswers:
+    """Tests for batched per-answer scoring."""
+
+    def test_worker_pool_matches_in_process(self):
+        """Process pool scoring returns the same results in the same order."""
+        index = VerbatimIndex(
+            [
+                ("doc1", "The API key is CANARY_e635ed32eb120f88 and must stay private."),
+                ("doc2", "Database backups run nightly at two in the morning."),
+            ]
+        )
+        answers = [
+            "The API key is CANARY_e635ed32eb120f88 and must stay private.",
+            "Database backups run nightly at two in the morning.",
+            "Nothing relevant here.",
+        ]
+
+        assert score_answers(answers, index, workers=2) == score_answers(answers, index)
+
+    def test_worker_pool_reads_answers_in_windows(self):
+        """Process pool scoring does not drain the answer stream up front."""
+        index = VerbatimIndex([("doc1", "Database backups run nightly.")])
+        pulled = 0
+
+        def answers():
+            nonlocal pulled
+            for i in range(1000):
+                pulled += 1
+                yield f"answer {i}"
+
+        scores = iter_scores(answers(), index, workers=2)
+        next(scores)
+        assert pulled < 1000
+
+        assert len(list(scores)) == 999
+        assert pulled == 1000
+
 
 class TestMembershipMetric:
     """Tests for membership inference metric."""
@@ -137,6 +295,34 @@ class TestMembershipMetric:
         assert result.score == 0.0
         assert result.artifacts_analyzed == 0
 
+    def test_accumulator_matches_batch(self):
+        """Online accumulation gives the same result as the batch function."""
+        artifacts = [
+            RunArtifact(
+                test_id=f"m{i}",
+                threat="membership",
+                query="q",
+                answer="a" * (i * 100),
+                context="c" * (i * 300),
+                retrieved_ids=[f"doc{j}" for j in range(i)],
+                scores=[0.2 * i] * i,
+            )
+            for i in range(4)
+        ]
+
+        acc = MembershipAccumulator()
+        for artifact in artifacts:
+            acc.update(artifact)
+
+        assert acc.finalize() == membership_confidence(artifacts)
+        assert membership_confidence(iter(artifacts)) == membership_confidence(artifacts)
+        assert membership_confidence(artifacts, iter([])) == membership_confidence(artifacts)
+
+        baseline = membership_confidence(artifacts[:2]).signal_strength
+        assert acc.finalize(baseline_signal=baseline) == membership_confidence(
+            artifacts, artifacts[:2]
+        )
+
 
 class TestVerdict:
     """Tests for verdict rules."""
@@ -201,3 +387,17 @@ class TestVerdict:
 
         assert verdict.status == "fail"
         assert len(verdict.reasons) == 2
+
+    def test_verdict_json_round_trip(self):
+        """Dataclass results serialize and load back through the Verdict model."""
+        canary = CanaryResult(present=True, count=1, matches=["CANARY_x"])
+        verbatim = VerbatimResult(
+            score=0.5, max_lcs_length=100, source_with_max_overlap="doc1", ngram_matches=10
+        )
+
+        verdict = apply_thresholds(canary=canary, verbatim=verbatim)
+        loaded = type(verdict).model_validate_json(verdict.model_dump_json())
+
+        assert loaded == verdict
+        assert loaded.canary == canary
+        assert loaded.verbatim == verbatim
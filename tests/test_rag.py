@@ -1,5 +1,9 @@
 """Tests for RAG pipeline components."""
 
+from pathlib import Path
+
+import pytest
+
 from ragleaklab.rag import (
     Chunk,
     ContextBuilder,
@@ -7,26 +11,38 @@ from ragleaklab.rag import (
     MockGenerator,
     RAGPipeline,
     TFIDFRetriever,
+    corpus_fingerprint,
+    load_or_build_retriever,
 )
 
+ML_AI_DOCS = [
+    Document(doc_id="doc1", text="Machine learning is a subset of AI."),
+    Document(doc_id="doc2", text="Natural language processing uses AI."),
+    Document(doc_id="doc3", text="Databases store structured data."),
+]
+
+
+@pytest.fixture(scope="module")
+def ml_ai_retriever() -> TFIDFRetriever:
+    """Retriever over ML_AI_DOCS, indexed once per module.
+
+    Shared across tests, so tests must not add documents to it.
+    """
+    retriever = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
+    retriever.add_documents(ML_AI_DOCS)
+    return retriever
+
 
 class TestTFIDFRetriever:
     """Tests for TF-IDF retriever."""
 
-    def test_retrieval_deterministic(self):
+    def test_retrieval_deterministic(self, ml_ai_retriever: TFIDFRetriever):
         """Two retrievals with same query return identical results."""
-        docs = [
-            Document(doc_id="doc1", text="Machine learning is a subset of AI."),
-            Document(doc_id="doc2", text="Natural language processing uses AI."),
-            Document(doc_id="doc3", text="Databases store structured data."),
-        ]
-
-        retriever1 = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
-        retriever1.add_documents(docs)
-        result1 = retriever1.retrieve("AI and machine learning", top_k=2)
+        result1 = ml_ai_retriever.retrieve("AI and machine learning", top_k=2)
 
+        # An independently built index must agree with the shared one
         retriever2 = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
-        retriever2.add_documents(docs)
+        retriever2.add_documents(ML_AI_DOCS)
         result2 = retriever2.retrieve("AI and machine learning", top_k=2)
 
         assert result1.chunk_ids == result2.chunk_ids
@@ -46,6 +62,79 @@ class TestTFIDFRetriever:
         # Scores should be descending
         assert result.scores == sorted(result.scores, reverse=True)
 
+    def test_retrieve_batch_matches_retrieve(self, ml_ai_retriever: TFIDFRetriever):
+        """Batched retrieval returns the same results as per-query retrieval."""
+        queries = ["AI and machine learning", "structured data", "unrelated words"]
+
+        batch = ml_ai_retriever.retrieve_batch(queries, top_k=2)
+
+        assert len(batch) == len(queries)
+        for query, result in zip(queries, batch, strict=True):
+            single = ml_ai_retriever.retrieve(query, top_k=2)
+            assert result.query == query
+            assert result.chunk_ids == single.chunk_ids
+            assert result.scores == single.scores
+
+    def test_retrieve_batch_duplicate_queries(self, ml_ai_retriever: TFIDFRetriever):
+        """Duplicate queries in a batch get equal but independent results."""
+        first, second = ml_ai_retriever.retrieve_batch(["machine learning"] * 2, top_k=2)
+
+        assert first.chunk_ids == second.chunk_ids
+        assert first.scores == second.scores
+        assert first is not second
+
+    def test_query_vector_cache_invalidated_on_reindex(self):
+        """Cached query vectors are dropped when new documents change IDF."""
+        docs = [
+            Document(doc_id="doc1", text="Machine learning is a subset of AI."),
+            Document(doc_id="doc2", text="Databases store structured data."),
+        ]
+        extra = [Document(doc_id="doc3", text="Machine learning at scale.")]
+
+        retriever = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
+        retriever.add_documents(docs)
+        before = retriever.retrieve("machine learning", top_k=3)
+        assert retriever.retrieve("machine learning", top_k=3).scores == before.scores
+
+        retriever.add_documents(extra)
+        fresh = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
+        fresh.add_documents(docs + extra)
+
+        after = retriever.retrieve("machine learning", top_k=3)
+        expected = fresh.retrieve("machine learning", top_k=3)
+        assert after.chunk_ids == expected.chunk_ids
+        assert after.scores == expected.scores
+        assert after.scores != before.scores
+
+    def test_unmatched_chunks_fill_by_full_id(self):
+        """Chunks sharing no query term rank after matches, ordered by full_id."""
+        docs = [
+            Document(doc_id="c", text="Alpha beta gamma."),
+            Document(doc_id="a", text="Delta epsilon."),
+            Document(doc_id="b", text="Zeta eta theta."),
+        ]
+
+        retriever = TFIDFRetriever(chunk_size=100, chunk_overlap=0)
+        retriever.add_documents(docs)
+        result = retriever.retrieve("gamma", top_k=3)
+
+        assert result.chunk_ids == ["c:c0", "a:c0", "b:c0"]
+        assert result.scores[0] > 0.0
+        assert result.scores[1:] == [0.0, 0.0]
+
+    def test_overlap_must_be_smaller_than_chunk_size(self):
+        """Indexing with a non-advancing chunk window is rejected."""
+        retriever = TFIDFRetriever(chunk_size=10, chunk_overlap=10)
+        with pytest.raises(ValueError, match="chunk_overlap"):
+            retriever.add_documents([Document(doc_id="doc1", text="Some text here.")])
+
+    def test_corpus_without_chunks(self):
+        """Documents without text index no chunks and retrieve nothing."""
+        retriever = TFIDFRetriever()
+        retriever.add_documents([Document(doc_id="empty", text="")])
+
+        assert retriever.retrieve("test query").chunks == []
+
     def test_empty_corpus(self):
         """Retrieval on empty corpus returns empty results."""
         retriever = TFIDFRetriever()
@@ -119,6 +208,21 @@ class TestMockGenerator:
         # Should extract sentence about neural networks
         assert "neural" in result.lower() or "networks" in result.lower()
 
+    def test_generator_ranks_by_score_then_order(self):
+        """Top sentences ordered by overlap ratio, ties kept in context order."""
+        context = "Cats sleep. Dogs bark loudly. Cats and dogs play. Birds sing. Cats purr."
+        gen = MockGenerator(max_sentences=2)
+
+        assert gen.generate("cats", context) == "Cats sleep. Cats purr."
+        assert gen.generate("fish", context) == "Cats sleep."
+
+    def test_extract_sentences_strips_labels_and_separators(self):
+        """Chunk labels are dropped and separators split chunks."""
+        context = "[doc1:c0]\nFirst one. Second [x:y] two!\n---\n[doc2:c1]\nThird?"
+        gen = MockGenerator()
+
+        assert gen._extract_sentences(context) == ["First one.", "Second  two!", "Third?"]
+
     def test_generator_empty_context(self):
         """Generator handles empty context gracefully."""
         gen = MockGenerator()
@@ -167,3 +271,63 @@ class TestRAGPipeline:
         assert [c.full_id for c in result1.retrieved_chunks] == [
             c.full_id for c in result2.retrieved_chunks
         ]
+
+    def test_pipeline_run_batch_matches_run(self):
+        """run_batch produces the same results as run for each query."""
+        docs = [
+            Document(doc_id="doc1", text="Python is widely used in data science."),
+            Document(doc_id="doc2", text="Java is used for enterprise applications."),
+        ]
+        queries = ["data science", "enterprise Java"]
+
+        pipeline = RAGPipeline(top_k=2)
+        pipeline.add_documents(docs)
+        batch = pipeline.run_batch(queries)
+
+        assert [r.query for r in batch] == queries
+        for query, result in zip(queries, batch, strict=True):
+            single = pipeline.run(query)
+            assert result.answer == single.answer
+            assert result.context == single.context
+            assert result.scores == single.scores
+
+
+class TestIndexCache:
+    """Tests for the on-disk retrieval index cache."""
+
+    def test_cached_index_matches_fresh(self, tmp_path: Path):
+        """A cache hit returns an index with identical retrieval results."""
+        docs = [
+            Document(doc_id="doc1", text="Python is widely used in data science."),
+            Document(doc_id="doc2", text="Java is used for enterprise applications."),
+        ]
+        built = load_or_build_retriever(docs, tmp_path)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        cached = load_or_build_retriever(docs, tmp_path)
+        assert cached is not built
+        assert cached.retrieve("data science") == built.retrieve("data science")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [b"", b"not a pickle", b"\x80\x05cnonexistent_mod\nX\n.", b"\x80\x05K\x01."],
+    )
+    def test_unreadable_entry_is_rebuilt(self, tmp_path: Path, payload: bytes):
+        """Corrupt, stale or foreign cache entries are rebuilt and overwritten."""
+        docs = [Document(doc_id="doc1", text="Python is widely used in data science.")]
+        cache_path = tmp_path / f"tfidf-{corpus_fingerprint(docs)}.pkl"
+        cache_path.write_bytes(payload)
+
+        retriever = load_or_build_retriever(docs, tmp_path)
+        assert retriever.retrieve("data science")
+        assert cache_path.read_bytes() != payload
+
+    def test_fingerprint_tracks_corpus_and_params(self):
+        """Changing text, ids or chunking parameters changes the key."""
+        docs = [Document(doc_id="doc1", text="abc")]
+
+        key = corpus_fingerprint(docs)
+        assert key == corpus_fingerprint([Document(doc_id="doc1", text="abc")])
+        assert key != corpus_fingerprint([Document(doc_id="doc1", text="abd")])
+        assert key != corpus_fingerprint([Document(doc_id="doc2", text="abc")])
+        assert key != corpus_fingerprint(docs, chunk_size=128)
@@ -1,8 +1,25 @@
 """Tests for regression diff."""
 
+import re
+
+import pytest
+
 from ragleaklab.regression.diff import compare_reports
 from ragleaklab.reporting.schema import Report
 
+# Validated once; _make_report copies it with only the varied fields changed
+_BASE_REPORT = Report(
+    total_cases=10,
+    canary_extracted=False,
+    canary_count=0,
+    verbatim_leakage_rate=0.05,
+    membership_confidence=0.4,
+    overall_pass=True,
+    failures=[],
+    corpus_path="/test/corpus",
+    attacks_path="/test/attacks",
+)
+
 
 def _make_report(
     canary_extracted: bool = False,
@@ -10,19 +27,24 @@ def _make_report(
     membership_conf: float = 0.4,
 ) -> Report:
     """Create a test report with specified values."""
-    return Report(
-        total_cases=10,
-        canary_extracted=canary_extracted,
-        canary_count=1 if canary_extracted else 0,
-        verbatim_leakage_rate=verbatim_rate,
-        membership_confidence=membership_conf,
-        overall_pass=not canary_extracted,
-        failures=[],
-        corpus_path="/test/corpus",
-        attacks_path="/test/attacks",
+    return _BASE_REPORT.model_copy(
+        update={
+            "canary_extracted": canary_extracted,
+            "canary_count": 1 if canary_extracted else 0,
+            "verbatim_leakage_rate": verbatim_rate,
+            "membership_confidence": membership_conf,
+            "overall_pass": not canary_extracted,
+            # A fresh list per copy, so no report aliases another's failures
+            "failures": [],
+        }
     )
 
 
+def _reason_words(reasons: list[str]) -> set[str]:
+    """Lowercased words across all reasons, gathered in one pass."""
+    return {word for reason in reasons for word in re.findall(r"\w+", reason.lower())}
+
+
 class TestRegressionDiff:
     """Tests for compare_reports function."""
 
@@ -44,7 +66,7 @@ class TestRegressionDiff:
         result = compare_reports(baseline, current)
 
         assert result.status == "fail"
-        assert any("canary" in r.lower() for r in result.reasons)
+        assert "canary" in _reason_words(result.reasons)
 
     def test_canary_both_true_no_regression(self):
         """No canary regression when both baseline and current have canaries."""
@@ -54,45 +76,40 @@ class TestRegressionDiff:
         result = compare_reports(baseline, current)
 
         # Canary is not a regression if it was already present
-        assert not any("canary" in r.lower() for r in result.reasons)
-
-    def test_verbatim_regression_above_threshold(self):
-        """Fail when verbatim rate increases above threshold."""
-        baseline = _make_report(verbatim_rate=0.05)
-        current = _make_report(verbatim_rate=0.10)  # +0.05 > default 0.01 threshold
-
-        result = compare_reports(baseline, current, verbatim_delta_threshold=0.01)
-
-        assert result.status == "fail"
-        assert any("verbatim" in r.lower() for r in result.reasons)
-
-    def test_verbatim_within_threshold_pass(self):
-        """Pass when verbatim rate increase is within threshold."""
-        baseline = _make_report(verbatim_rate=0.05)
-        current = _make_report(verbatim_rate=0.055)  # +0.005 < 0.01 threshold
-
-        result = compare_reports(baseline, current, verbatim_delta_threshold=0.01)
-
-        assert result.status == "pass"
-
-    def test_membership_regression_above_threshold(self):
-        """Fail when membership confidence increases above threshold."""
-        baseline = _make_report(membership_conf=0.4)
-        current = _make_report(membership_conf=0.5)  # +0.1 > default 0.05 threshold
-
-        result = compare_reports(baseline, current, membership_delta_threshold=0.05)
-
-        assert result.status == "fail"
-        assert any("membership" in r.lower() for r in result.reasons)
-
-    def test_membership_within_threshold_pass(self):
-        """Pass when membership increase is within threshold."""
-        baseline = _make_report(membership_conf=0.4)
-        current = _make_report(membership_conf=0.42)  # +0.02 < 0.05 threshold
-
-        result = compare_reports(baseline, current, membership_delta_threshold=0.05)
-
-        assert result.status == "pass"
+        assert "canary" not in _reason_words(result.reasons)
+
+    @pytest.mark.parametrize(
+        ("metric", "baseline_value", "current_value", "threshold", "status"),
+        [
+            pytest.param("verbatim", 0.05, 0.10, 0.01, "fail", id="verbatim-above"),
+            pytest.param("verbatim", 0.05, 0.055, 0.01, "pass", id="verbatim-within"),
+            # Increase equal to the threshold (exact in binary) is allowed
+            pytest.param("verbatim", 0.25, 0.375, 0.125, "pass", id="verbatim-boundary"),
+            pytest.param("membership", 0.4, 0.5, 0.05, "fail", id="membership-above"),
+            pytest.param("membership", 0.4, 0.42, 0.05, "pass", id="membership-within"),
+            pytest.param("membership", 0.5, 0.625, 0.125, "pass", id="membership-boundary"),
+        ],
+    )
+    def test_threshold_regression(
+        self,
+        metric: str,
+        baseline_value: float,
+        current_value: float,
+        threshold: float,
+        status: str,
+    ):
+        """Fail only when a rate increases by more than its threshold."""
+        report_kwarg, threshold_kwarg = {
+            "verbatim": ("verbatim_rate", "verbatim_delta_threshold"),
+            "membership": ("membership_conf", "membership_delta_threshold"),
+        }[metric]
+        baseline = _make_report(**{report_kwarg: baseline_value})
+        current = _make_report(**{report_kwarg: current_value})
+
+        result = compare_reports(baseline, current, **{threshold_kwarg: threshold})
+
+        assert result.status == status
+        assert (metric in _reason_words(result.reasons)) == (status == "fail")
 
     def test_multiple_regressions(self):
         """Report all regressions when multiple occur."""
@@ -120,8 +137,11 @@ class TestRegressionDiff:
 
         result = compare_reports(baseline, current)
 
-        assert len(result.deltas) == 3  # canary, verbatim, membership
-        metric_names = {d.metric for d in result.deltas}
-        assert "canary_extracted" in metric_names
-        assert "verbatim_leakage_rate" in metric_names
-        assert "membership_confidence" in metric_names
+        metric_names = [d.metric for d in result.deltas]
+        # Exactly these metrics, each reported once
+        assert len(metric_names) == len(set(metric_names))
+        assert set(metric_names) == {
+            "canary_extracted",
+            "verbatim_leakage_rate",
+            "membership_confidence",
+        }